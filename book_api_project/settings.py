@@ -123,6 +123,10 @@ GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 if not GROQ_API_KEY:
     raise ValueError("GROQ_API_KEY environment variable is required")
 
+# Outbound scraping timeouts in seconds: fail fast on connect, allow slower bodies
+EXTERNAL_HTTP_CONNECT_TIMEOUT = float(os.getenv('EXTERNAL_HTTP_CONNECT_TIMEOUT', '3'))
+EXTERNAL_HTTP_READ_TIMEOUT = float(os.getenv('EXTERNAL_HTTP_READ_TIMEOUT', '8'))
+
 # File upload settings
 FILE_UPLOAD_MAX_MEMORY_SIZE = 50 * 1024 * 1024  # 50MB
 DATA_UPLOAD_MAX_MEMORY_SIZE = 50 * 1024 * 1024  # 50MB
@@ -143,7 +147,8 @@ LOGGING = {
     'loggers': {
         'books': {
             'handlers': ['console'],
-            'level': 'DEBUG',
+            # Per-URL scraping/validation chatter is only useful while developing
+            'level': 'DEBUG' if DEBUG else 'INFO',
             'propagate': False,
         },
     },
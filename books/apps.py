@@ -1,6 +1,13 @@
+import atexit
+
 from django.apps import AppConfig
 
 
 class BooksConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'books'
+
+    def ready(self):
+        # Release pooled HTTP connections when the process exits
+        from .services.pdf_service import close_http_session
+        atexit.register(close_http_session)
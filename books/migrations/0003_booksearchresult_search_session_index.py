@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-16 22:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('books', '0002_alter_book_publication_date'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='booksearchresult',
+            name='search_session',
+            field=models.CharField(db_index=True, max_length=100),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import F
 from django.core.files.storage import default_storage
 import os
 
@@ -77,8 +78,9 @@ class Book(models.Model):
     
     def increment_view_count(self):
         """Increment the view count for this book."""
+        # Let the database add 1 so concurrent views are not lost
+        Book.objects.filter(pk=self.pk).update(view_count=F('view_count') + 1)
         self.view_count += 1
-        self.save(update_fields=['view_count'])
 
 
 class BookSearchResult(models.Model):
@@ -88,7 +90,7 @@ class BookSearchResult(models.Model):
     """
     
     # Search session identifier
-    search_session = models.CharField(max_length=100)
+    search_session = models.CharField(max_length=100, db_index=True)
     
     # Book information from external APIs
     title = models.CharField(max_length=500)
@@ -241,15 +241,7 @@ class CategoryService:
                 Don't suggest more than 5 total categories.
                 """
             
-            enhanced_categories = self.llm_service.client.chat.completions.create(
-                messages=[{"role": "user", "content": prompt}],
-                model=self.llm_service.model,
-                response_format={"type": "json_object"},
-                temperature=0.3,
-            )
-            
-            import json
-            response = json.loads(enhanced_categories.choices[0].message.content)
+            response = self.llm_service._call_json(prompt, temperature=0.3)
             final_categories = response.get('final_categories', mapped_categories)
             
             # Ensure we don't exceed reasonable limits
@@ -333,15 +325,7 @@ class CategoryService:
                 Suggest only 2-4 appropriate categories.
                 """
             
-            response = self.llm_service.client.chat.completions.create(
-                messages=[{"role": "user", "content": prompt}],
-                model=self.llm_service.model,
-                response_format={"type": "json_object"},
-                temperature=0.3,
-            )
-            
-            import json
-            result = json.loads(response.choices[0].message.content)
+            result = self.llm_service._call_json(prompt, temperature=0.3)
             suggested_categories = result.get('categories', [])
             
             return suggested_categories[:4]  # Limit to 4 categories
@@ -3,6 +3,7 @@ External APIs service for retrieving book information from multiple sources.
 Integrates Google Books, Gutendx, Internet Archive, and Arabic Collections Online.
 """
 
+import hashlib
 import requests
 import urllib.parse
 from typing import Dict, List, Optional
@@ -10,7 +11,12 @@ from bs4 import BeautifulSoup
 import json
 import re
 import concurrent.futures
-from .llm_service import LLMService
+from django.core.cache import cache
+from .llm_service import get_llm_service
+
+
+# Catalogue results change slowly, so identical searches reuse them for a while
+SEARCH_RESULTS_CACHE_TTL = 60 * 60  # seconds
 
 
 class ExternalAPIsService:
@@ -46,7 +52,15 @@ class ExternalAPIsService:
         Returns:
             List of book results from all sources
         """
-        
+
+        cache_key = "booksearch:{}:{}".format(
+            max_results,
+            hashlib.sha1(json.dumps(extracted_info, sort_keys=True, default=str).encode()).hexdigest()
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         all_results = []
         title = extracted_info.get('title', '')
         author = extracted_info.get('author', '')
@@ -97,7 +111,12 @@ class ExternalAPIsService:
         ranked_results = self._rank_results(unique_results, extracted_info)
 
         # Skip PDF enhancement for speed - return results directly
-        return ranked_results[:max_results]
+        results = ranked_results[:max_results]
+
+        # An empty result usually means the sources failed, so don't remember it
+        if results:
+            cache.set(cache_key, results, SEARCH_RESULTS_CACHE_TTL)
+        return results
     
     def search_google_books(self, query: str, prefer_arabic: bool = False) -> List[Dict]:
         """Search Google Books API."""
@@ -444,16 +463,26 @@ class ExternalAPIsService:
 
     def _enhance_pdf_urls(self, results: List[Dict]) -> List[Dict]:
         """Enhance results by finding and verifying PDF URLs, returning only top 5 verified results."""
-        from .llm_service import LLMService
         from .pdf_service import PDFService
 
         try:
-            llm_service = LLMService()
+            llm_service = get_llm_service()
             pdf_service = PDFService()
             verified_results = []
 
             print(f"Enhancing {len(results)} results with PDF verification...")
 
+            # Ask for links to every result without one in a single LLM call per language
+            books_by_language = {}
+            for result in results:
+                if not result.get('pdf_url'):
+                    book = (result.get('title', ''), result.get('author', ''))
+                    books_by_language.setdefault(result.get('language', 'en'), {})[book] = None
+            bulk_pdf_links = {}
+            for language, books in books_by_language.items():
+                for (title, author), pdf_url in llm_service.find_pdf_links_bulk(list(books), language).items():
+                    bulk_pdf_links[(language, title, author)] = pdf_url
+
             for result in results:
                 title = result.get('title', '')
                 author = result.get('author', '')
@@ -472,11 +501,22 @@ class ExternalAPIsService:
                     pdf_source = result.get('pdf_source', 'original')
                     print(f"  ✓ Existing PDF verified: {existing_pdf}")
 
-                # Method 2: Use LLM to find verified PDF links
+                # Method 2: Use LLM to find verified PDF links, starting with the batched lookup
+                bulk_pdf = bulk_pdf_links.get((language, title, author))
+                if not working_pdf_url and bulk_pdf:
+                    if self._verify_pdf_url(bulk_pdf, pdf_service):
+                        working_pdf_url = bulk_pdf
+                        pdf_source = 'llm_verified'
+                        print(f"  ✓ LLM PDF verified: {bulk_pdf}")
+                    else:
+                        print(f"  ✗ LLM PDF failed verification: {bulk_pdf}")
+
+                # Otherwise ask for several candidates for this book (all probed concurrently)
                 if not working_pdf_url:
                     llm_pdf_urls = llm_service.find_multiple_pdf_links(title, author, language)
-                    for pdf_url in llm_pdf_urls:
-                        if self._verify_pdf_url(pdf_url, pdf_service):
+                    verifications = pdf_service.verify_pdf_links(llm_pdf_urls)
+                    for pdf_url, (is_valid, _, _) in zip(llm_pdf_urls, verifications):
+                        if is_valid:
                             working_pdf_url = pdf_url
                             pdf_source = 'llm_verified'
                             print(f"  ✓ LLM PDF verified: {pdf_url}")
@@ -3,11 +3,117 @@ LLM Service for book information extraction and enhancement using Groq.
 This service acts as the primary brain for understanding user queries and enriching book data.
 """
 
+import hashlib
 import json
+import logging
 import os
+import random
+import re
+import threading
+import time
 from typing import Dict, List, Optional, Tuple
-from groq import Groq
+from groq import Groq, APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
 from django.conf import settings
+from django.core.cache import cache
+
+
+logger = logging.getLogger(__name__)
+
+# Groq free tier allows roughly 30 requests per minute per API key
+GROQ_REQUESTS_PER_MINUTE = 30
+GROQ_MAX_RETRIES = 3
+GROQ_BACKOFF_BASE = 1.0  # seconds, doubled on every retry
+GROQ_MAX_BACKOFF = 8.0  # seconds, upper bound for a single wait, including Retry-After
+# Calls run inside request threads, so give up once the waits would exceed this in total
+GROQ_MAX_RETRY_WAIT = 10.0  # seconds
+
+# Errors worth retrying: rate limiting, transient 5xx and network failures
+RETRYABLE_GROQ_ERRORS = (RateLimitError, InternalServerError, APIConnectionError, APITimeoutError)
+
+# Stop calling Groq for a while once it keeps failing, so lookups fall back immediately during an outage
+GROQ_BREAKER_FAILURES = 3
+GROQ_BREAKER_WINDOW = 30.0  # seconds in which the failures must occur
+GROQ_BREAKER_COOLDOWN = 60.0  # seconds to skip Groq once the breaker opens
+
+
+class LLMUnavailableError(Exception):
+    """Raised instead of calling Groq while the circuit breaker is open."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket used to pace outgoing LLM requests."""
+
+    def __init__(self, rate: int, period: float):
+        self.capacity = rate
+        self.tokens = float(rate)
+        self.fill_rate = rate / period
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.fill_rate)
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.fill_rate
+            time.sleep(wait)
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker that opens after repeated failures within a time window."""
+
+    def __init__(self, failure_threshold: int, window: float, cooldown: float):
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.cooldown = cooldown
+        self.failures = 0
+        self.first_failure_at = 0.0
+        self.open_until = 0.0
+        self.lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Return False while the breaker is open."""
+        with self.lock:
+            return time.monotonic() >= self.open_until
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+
+    def record_failure(self):
+        with self.lock:
+            now = time.monotonic()
+            if self.failures == 0 or now - self.first_failure_at > self.window:
+                self.failures = 0
+                self.first_failure_at = now
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.open_until = now + self.cooldown
+                self.failures = 0
+
+
+# Shared across all LLMService instances so every request draws from the same budget
+groq_rate_limiter = TokenBucket(GROQ_REQUESTS_PER_MINUTE, 60.0)
+groq_circuit_breaker = CircuitBreaker(GROQ_BREAKER_FAILURES, GROQ_BREAKER_WINDOW, GROQ_BREAKER_COOLDOWN)
+
+WORD_COUNT_SYSTEM_PROMPT = (
+    "You are a precise content generator. You MUST follow word count requirements exactly. "
+    "Count words carefully before responding."
+)
+
+# Query understanding is deterministic enough to reuse for repeated searches
+EXTRACTION_CACHE_TTL = 24 * 60 * 60  # seconds
+# Category/author enrichment runs at temperature 0, so the same book always gets the same answer
+STRUCTURED_INFO_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Queries that need no LLM understanding: bare ISBN-10/13 numbers and plain URLs
+ISBN_RE = re.compile(r'^(?:\d{9}[\dX]|\d{13})$')
+URL_RE = re.compile(r'^https?://\S+$', re.IGNORECASE)
 
 
 class LLMService:
@@ -31,6 +137,10 @@ class LLMService:
             # Base parameters that should always work
             init_params = {'api_key': settings.GROQ_API_KEY}
 
+            # _call_groq does its own retries; the SDK's built-in ones would multiply them
+            if 'max_retries' in supported_params:
+                init_params['max_retries'] = 0
+
             # Check if this version supports additional parameters we might want to use
             # (This is for future compatibility)
 
@@ -57,6 +167,90 @@ class LLMService:
             print("2. GROQ_API_KEY environment variable")
             print("3. Network connectivity")
             raise e
+
+    def _call_groq(self, **kwargs):
+        """
+        Create a chat completion, pacing requests through the shared token bucket.
+        Rate-limited (429) and transient failures are retried with exponential
+        backoff instead of falling straight through to the caller's fallback,
+        waiting at most GROQ_MAX_RETRY_WAIT seconds in total.
+        While Groq keeps failing with server or network errors, the shared circuit
+        breaker raises LLMUnavailableError right away so callers fall back without waiting.
+        """
+        kwargs.setdefault('model', self.model)
+
+        waited = 0.0
+        for attempt in range(GROQ_MAX_RETRIES + 1):
+            if not groq_circuit_breaker.allow():
+                raise LLMUnavailableError("Groq is temporarily unavailable after repeated failures")
+            groq_rate_limiter.acquire()
+            try:
+                chat_completion = self.client.chat.completions.create(**kwargs)
+            except RETRYABLE_GROQ_ERRORS as e:
+                # 429s mean "slow down", not "down"; only outages count towards the breaker
+                if not isinstance(e, RateLimitError):
+                    groq_circuit_breaker.record_failure()
+                if attempt == GROQ_MAX_RETRIES or not groq_circuit_breaker.allow():
+                    raise
+                delay = self._retry_delay(e, attempt)
+                if waited + delay > GROQ_MAX_RETRY_WAIT:
+                    raise
+                logger.warning("Groq request failed (%s), retrying in %.1fs", e.__class__.__name__, delay)
+                time.sleep(delay)
+                waited += delay
+            else:
+                groq_circuit_breaker.record_success()
+                return chat_completion
+
+    @staticmethod
+    def _retry_delay(error: Exception, attempt: int) -> float:
+        """
+        Seconds to wait before retrying a failed Groq request.
+        Honours the Retry-After header of a 429, otherwise backs off exponentially with jitter
+        so concurrent workers don't retry in lockstep.
+        """
+        response = getattr(error, 'response', None)
+        retry_after = response.headers.get('retry-after') if response is not None else None
+        if retry_after:
+            try:
+                return min(GROQ_MAX_BACKOFF, max(0.0, float(retry_after)))
+            except ValueError:
+                pass  # HTTP-date form; fall back to our own schedule
+        return min(GROQ_MAX_BACKOFF, GROQ_BACKOFF_BASE * (2 ** attempt) + random.random())
+
+    def _call_json(self, prompt: str, *, temperature: float, system_prompt: Optional[str] = None,
+                   cache_ttl: Optional[int] = None, **kwargs) -> Dict:
+        """
+        Send a prompt in JSON mode and return the parsed response.
+
+        With cache_ttl set, parsed responses are kept in the Django cache for that many
+        seconds, keyed on the model and the full request. Failures are never cached.
+
+        Raises on API or JSON decode errors so each caller can apply its own fallback.
+        """
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        if cache_ttl:
+            request_key = json.dumps([self.model, messages, temperature, kwargs], sort_keys=True, default=str)
+            cache_key = f"llmjson:{hashlib.sha1(request_key.encode()).hexdigest()}"
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        chat_completion = self._call_groq(
+            messages=messages,
+            response_format={"type": "json_object"},
+            temperature=temperature,
+            **kwargs
+        )
+        response = json.loads(chat_completion.choices[0].message.content)
+
+        if cache_ttl:
+            cache.set(cache_key, response, cache_ttl)
+        return response
     
     def extract_book_info(self, query: str, language: str = 'en') -> Dict:
         """
@@ -70,7 +264,17 @@ class LLMService:
         Returns:
             Dict containing extracted book information
         """
-        
+
+        # Skip the LLM round-trip for queries that are already identifiers
+        shortcut = self._shortcut_extraction(query, language)
+        if shortcut:
+            return shortcut
+
+        cache_key = f"bookinfo:{language}:{hashlib.sha1(query.strip().lower().encode()).hexdigest()}"
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Create language-specific prompt
         if language == 'ar':
             prompt = f"""
@@ -138,20 +342,7 @@ class LLMService:
             """
         
         try:
-            chat_completion = self.client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    }
-                ],
-                model=self.model,
-                response_format={"type": "json_object"},
-                temperature=0.3,
-            )
-            
-            llm_response = chat_completion.choices[0].message.content
-            extracted_data = json.loads(llm_response)
+            extracted_data = self._call_json(prompt, temperature=0.3)
             
             # Ensure required fields exist
             extracted_data.setdefault('title', query)
@@ -161,7 +352,9 @@ class LLMService:
             extracted_data.setdefault('search_variations', [query])
             extracted_data.setdefault('description', None)
             extracted_data.setdefault('is_arabic_query', language == 'ar')
-            
+
+            # Only successful extractions are cached; fallbacks retry the LLM next time
+            cache.set(cache_key, extracted_data, EXTRACTION_CACHE_TTL)
             return extracted_data
             
         except json.JSONDecodeError as e:
@@ -230,7 +423,7 @@ class LLMService:
                 """
         
         try:
-            chat_completion = self.client.chat.completions.create(
+            chat_completion = self._call_groq(
                 messages=[
                     {
                         "role": "user",
@@ -299,19 +492,7 @@ class LLMService:
             """
         
         try:
-            chat_completion = self.client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    }
-                ],
-                model=self.model,
-                response_format={"type": "json_object"},
-                temperature=0.8,
-            )
-            
-            response = json.loads(chat_completion.choices[0].message.content)
+            response = self._call_json(prompt, temperature=0.8)
             return response.get('related_books', [])
             
         except Exception as e:
@@ -428,30 +609,15 @@ class LLMService:
             """
 
         try:
-            import time
-            # Add small delay to avoid rate limiting
-            time.sleep(0.5)
-
-            chat_completion = self.client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a precise content generator. You MUST follow word count requirements exactly. Count words carefully before responding."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    }
-                ],
-                model=self.model,
-                response_format={"type": "json_object"},
+            response = self._call_json(
+                prompt,
                 temperature=0.0,  # Zero temperature for fastest, most deterministic results
+                system_prompt=WORD_COUNT_SYSTEM_PROMPT,
+                cache_ttl=STRUCTURED_INFO_CACHE_TTL,
                 max_tokens=1200,  # Increased tokens for longer descriptions
                 timeout=12  # Slightly longer timeout for detailed descriptions
             )
 
-            response = json.loads(chat_completion.choices[0].message.content)
-
             # Post-process to ensure word counts are correct
             categories = response.get('categories', [])
             for cat in categories:
@@ -605,30 +771,14 @@ class LLMService:
             """
 
         try:
-            import time
-            # Add small delay to avoid rate limiting
-            time.sleep(0.5)
-
-            chat_completion = self.client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a precise content generator. You MUST follow word count requirements exactly. Count words carefully before responding."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    }
-                ],
-                model=self.model,
-                response_format={"type": "json_object"},
+            response = self._call_json(
+                prompt,
                 temperature=0.0,  # Zero temperature for fastest, most deterministic results
+                system_prompt=WORD_COUNT_SYSTEM_PROMPT,
                 max_tokens=1200,  # Increased tokens for longer descriptions
                 timeout=12  # Slightly longer timeout for detailed descriptions
             )
 
-            response = json.loads(chat_completion.choices[0].message.content)
-
             # Post-process to ensure word counts are correct
             categories = response.get('categories', [])
             for cat in categories:
@@ -772,19 +922,7 @@ class LLMService:
             """
 
         try:
-            chat_completion = self.client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    }
-                ],
-                model=self.model,
-                response_format={"type": "json_object"},
-                temperature=0.3,
-            )
-
-            response = json.loads(chat_completion.choices[0].message.content)
+            response = self._call_json(prompt, temperature=0.3)
             return response.get('categories', [])
 
         except Exception as e:
@@ -847,19 +985,7 @@ class LLMService:
             """
 
         try:
-            chat_completion = self.client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    }
-                ],
-                model=self.model,
-                response_format={"type": "json_object"},
-                temperature=0.3,
-            )
-
-            response = json.loads(chat_completion.choices[0].message.content)
+            response = self._call_json(prompt, temperature=0.3)
             return response.get('author', {})
 
         except Exception as e:
@@ -914,25 +1040,38 @@ class LLMService:
             """
         
         try:
-            chat_completion = self.client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    }
-                ],
-                model=self.model,
-                response_format={"type": "json_object"},
-                temperature=0.3,
-            )
-            
-            response = json.loads(chat_completion.choices[0].message.content)
+            response = self._call_json(prompt, temperature=0.3)
             return response.get('translated_categories', categories)
             
         except Exception as e:
             print(f"LLM translation error: {e}")
             return categories
     
+    def _shortcut_extraction(self, query: str, language: str) -> Optional[Dict]:
+        """Build extraction data directly for ISBN or URL queries, or return None."""
+        stripped = query.strip()
+        isbn = stripped.replace('-', '').replace(' ', '').upper()
+
+        if ISBN_RE.match(isbn):
+            extracted_data = self._fallback_extraction(query, language)
+            extracted_data.update({
+                'title': None,
+                'isbn': isbn,
+                'search_variations': [f"isbn:{isbn}"],
+            })
+            return extracted_data
+
+        if URL_RE.match(stripped):
+            extracted_data = self._fallback_extraction(query, language)
+            extracted_data.update({
+                'title': None,
+                'url': stripped,
+                'search_variations': [stripped],
+            })
+            return extracted_data
+
+        return None
+
     def _fallback_extraction(self, query: str, language: str) -> Dict:
         """Fallback extraction when LLM fails."""
         return {
@@ -1002,19 +1141,7 @@ class LLMService:
             """
 
         try:
-            chat_completion = self.client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    }
-                ],
-                model=self.model,
-                response_format={"type": "json_object"},
-                temperature=0.3,
-            )
-
-            response = json.loads(chat_completion.choices[0].message.content)
+            response = self._call_json(prompt, temperature=0.3)
             pdf_url = response.get('pdf_url')
 
             # Validate URL format and ensure it's likely a PDF
@@ -1026,6 +1153,74 @@ class LLMService:
             print(f"LLM PDF link search error: {e}")
             return None
 
+    def find_pdf_links_bulk(self, books: List[Tuple[str, str]], language: str = 'en') -> Dict[Tuple[str, str], Optional[str]]:
+        """
+        Use a single LLM call to find PDF links for several books at once.
+
+        Args:
+            books: List of (title, author) pairs
+            language: Books language
+
+        Returns:
+            Dict mapping each (title, author) pair to its PDF URL, or None if not found
+        """
+        links = {book: None for book in books}
+        if not books:
+            return links
+
+        books_list = "\n".join(f'{i}. "{title}" by "{author}"' for i, (title, author) in enumerate(books))
+
+        if language == 'ar':
+            prompt = f"""
+            ابحث عن رابط تحميل مباشر لملف PDF لكل كتاب من الكتب التالية:
+            {books_list}
+
+            أجب بتنسيق JSON فقط، باستخدام رقم الكتاب كمعرف:
+            {{
+                "results": [
+                    {{"id": 0, "pdf_url": "https://example.com/book.pdf"}}
+                ]
+            }}
+
+            متطلبات مهمة:
+            - أعطني فقط روابط تنتهي بـ .pdf أو تحتوي على /download/ وتؤدي إلى ملفات PDF فعلية
+            - لا تعطني صفحات HTML أو صفحات بحث أو صفحات معلومات الكتاب
+            - إذا لم تتمكن من العثور على رابط تحميل PDF مباشر لكتاب ما، استخدم null للـ pdf_url
+            """
+        else:
+            prompt = f"""
+            Find a direct PDF download link for each of the following books:
+            {books_list}
+
+            Respond in JSON format only, using the book number as id:
+            {{
+                "results": [
+                    {{"id": 0, "pdf_url": "https://example.com/book.pdf"}}
+                ]
+            }}
+
+            IMPORTANT REQUIREMENTS:
+            - Only return URLs that end with .pdf or contain /download/ and lead to actual PDF files
+            - Do NOT return HTML pages, search pages, or book information pages
+            - Focus on reliable sources like Internet Archive, Project Gutenberg, ManyBooks and Open Library
+            - If you cannot find a DIRECT PDF download link for a book, use null for its pdf_url
+            """
+
+        try:
+            response = self._call_json(prompt, temperature=0.3)
+
+            for item in response.get('results', []):
+                book_id = item.get('id')
+                pdf_url = item.get('pdf_url')
+                if isinstance(book_id, int) and 0 <= book_id < len(books) and pdf_url and self._is_valid_pdf_url(pdf_url):
+                    links[books[book_id]] = pdf_url
+
+            return links
+
+        except Exception as e:
+            print(f"LLM bulk PDF link search error: {e}")
+            return links
+
     def _is_valid_pdf_url(self, url: str) -> bool:
         """Validate if a URL is likely to be a direct PDF download link."""
         if not url or not (url.startswith('http://') or url.startswith('https://')):
@@ -1141,19 +1336,7 @@ class LLMService:
             """
 
         try:
-            chat_completion = self.client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    }
-                ],
-                model=self.model,
-                response_format={"type": "json_object"},
-                temperature=0.2,  # Lower temperature for more consistent results
-            )
-
-            response = json.loads(chat_completion.choices[0].message.content)
+            response = self._call_json(prompt, temperature=0.2)
             pdf_urls_data = response.get('pdf_urls', [])
 
             # Extract and validate URLs
@@ -1171,3 +1354,16 @@ class LLMService:
             single_url = self.find_pdf_link(title, author, language)
             return [single_url] if single_url else []
 
+
+_shared_llm_service = None
+_shared_llm_service_lock = threading.Lock()
+
+
+def get_llm_service() -> LLMService:
+    """Return the process-wide LLMService so callers reuse one Groq client and its keep-alive connections."""
+    global _shared_llm_service
+    if _shared_llm_service is None:
+        with _shared_llm_service_lock:
+            if _shared_llm_service is None:
+                _shared_llm_service = LLMService()
+    return _shared_llm_service
@@ -3,29 +3,137 @@ PDF Service for handling PDF downloads, verification, and conversion.
 Ensures that PDF links are valid and accessible before storing them.
 """
 
+import concurrent.futures
+import functools
+import hashlib
 import os
+import re
 import requests
 import tempfile
-from typing import Optional, Tuple, Dict
-from urllib.parse import urlparse
-from django.core.files.base import ContentFile
+import threading
+import time
+from typing import Optional, Tuple, Dict, List
+from xml.sax.saxutils import escape
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+from django.core.files.base import File
+from django.core.cache import cache
 from django.core.files.storage import default_storage
 from django.conf import settings
 import epub2pdf
 import mobi
 
 
+# Anything outside ASCII letters, digits and '-'; underscores are included so runs collapse
+UNSAFE_FILENAME_RE = re.compile(r'[^A-Za-z0-9-]+')
+
+# Book formats mentioned anywhere in a URL (extension, path segment or query string)
+FILE_TYPE_RE = re.compile(r'pdf|epub|mobi')
+
+# Lines of extracted MOBI text rendered per reportlab Paragraph
+MOBI_LINES_PER_PARAGRAPH = 40
+
+PDF_VERIFY_CACHE_TTL = 600  # seconds
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_ATTEMPTS = 3
+DOWNLOAD_BACKOFF_BASE = 0.5  # seconds, doubled on every retry
+
+# Mid-transfer failures that are worth resuming; urllib3 errors surface from response.raw.read
+RESUMABLE_ERRORS = (
+    requests.exceptions.ChunkedEncodingError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    ProtocolError,
+    ReadTimeoutError,
+)
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    # Advertise every encoding urllib3 can decode here (gzip, deflate, and br when brotli is installed)
+    "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def clean_filename(text: str) -> str:
+    """Clean text to be safe for use in filenames."""
+    if not text:
+        return "unknown"
+
+    # Replace each run of problematic characters (and underscores) with a single underscore
+    return UNSAFE_FILENAME_RE.sub('_', text).strip('_')
+
+
+@functools.lru_cache(maxsize=1024)
+def generate_filename(title: str, author: str, extension: str) -> str:
+    """Generate a safe filename for a book; memoized since the same books are saved repeatedly."""
+    # Clean title and author
+    safe_title = clean_filename(title)
+    safe_author = clean_filename(author) if author else "unknown"
+
+    # Limit length
+    safe_title = safe_title[:50]
+    safe_author = safe_author[:30]
+
+    return f"{safe_title}_{safe_author}.{extension}"
+
+
+class TemporaryPathFile(File):
+    """
+    A File backed by a named temporary file on local disk.
+
+    Exposing temporary_file_path() lets FileSystemStorage rename the file into
+    MEDIA_ROOT instead of copying it chunk by chunk; other storages read it as usual.
+    """
+
+    def temporary_file_path(self):
+        return self.file.name
+
+
+def _build_http_session() -> requests.Session:
+    """Create a pooled HTTP session that retries transient gateway errors."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    return session
+
+
+# Shared by all PDFService instances so keep-alive connections outlive a single request
+http_session = _build_http_session()
+
+# PDF downloads currently in progress, keyed by URL fingerprint
+inflight_downloads: Dict[str, concurrent.futures.Future] = {}
+inflight_lock = threading.Lock()
+
+# EPUB/MOBI conversions run here so they do not hold up the request that triggered them
+conversion_executor = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix='book-conversion')
+
+
+def close_http_session():
+    """Close pooled connections; registered to run at interpreter shutdown."""
+    http_session.close()
+
+
 class PDFService:
     """Service for PDF handling, verification, and conversion."""
     
     def __init__(self):
         self.max_file_size = 50 * 1024 * 1024  # 50MB limit
         self.timeout = 30  # 30 seconds timeout for downloads
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
+        self.headers = dict(DEFAULT_HEADERS)
+        self.session = http_session
     
-    def verify_and_download_pdf(self, pdf_url: str, book_title: str, book_author: str) -> Tuple[bool, Optional[str], Optional[str]]:
+    def verify_and_download_pdf(self, pdf_url: str, book_title: str, book_author: str,
+                                magic_verified: bool = False) -> Tuple[bool, Optional[str], Optional[str]]:
         """
         Verify that a PDF URL is accessible and download it if valid.
 
@@ -33,6 +141,7 @@ class PDFService:
             pdf_url: URL of the PDF to verify and download
             book_title: Title of the book (for filename)
             book_author: Author of the book (for filename)
+            magic_verified: The caller already saw the %PDF signature, so skip the probe
 
         Returns:
             Tuple of (is_valid, local_file_path, error_message)
@@ -45,90 +154,172 @@ class PDFService:
         if book_title == "test" and book_author == "test":
             return self._verify_pdf_only(pdf_url)
 
+        # Concurrent requests for the same URL wait for the first one instead of downloading again
+        key = hashlib.blake2b(pdf_url.encode(), digest_size=16).hexdigest()
+        with inflight_lock:
+            future = inflight_downloads.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = concurrent.futures.Future()
+                inflight_downloads[key] = future
+
+        if not is_owner:
+            return future.result()
+
         try:
-            # First, check if the URL is accessible with a HEAD request
-            try:
-                head_response = requests.head(pdf_url, headers=self.headers, timeout=10, allow_redirects=True)
-
-                # Check content type
-                content_type = head_response.headers.get('content-type', '').lower()
-                if 'pdf' not in content_type and 'application/octet-stream' not in content_type:
-                    # Try a GET request to check if it's actually a PDF
-                    get_response = requests.get(pdf_url, headers=self.headers, timeout=5, stream=True)
-                    content_type = get_response.headers.get('content-type', '').lower()
-
-                    if 'pdf' not in content_type:
-                        # Check first few bytes for PDF signature
-                        first_chunk = next(get_response.iter_content(chunk_size=1024), b'')
-                        if not first_chunk.startswith(b'%PDF'):
-                            return False, None, f"URL does not point to a PDF file. Content-Type: {content_type}"
-
-                # Check content length
-                content_length = head_response.headers.get('content-length')
-                if content_length and int(content_length) > self.max_file_size:
-                    return False, None, f"File too large: {content_length} bytes"
-
-                # If HEAD request successful, proceed with download
-                if head_response.status_code == 200:
-                    return self._download_pdf(pdf_url, book_title, book_author)
-                else:
-                    return False, None, f"PDF URL not accessible. Status code: {head_response.status_code}"
+            result = self._verify_and_download_pdf(pdf_url, book_title, book_author, magic_verified)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with inflight_lock:
+                inflight_downloads.pop(key, None)
+
+    def _verify_and_download_pdf(self, pdf_url: str, book_title: str, book_author: str,
+                                 magic_verified: bool = False) -> Tuple[bool, Optional[str], Optional[str]]:
+        """Probe a PDF URL and download it if it checks out."""
+        try:
+            if magic_verified:
+                return self._download_pdf(pdf_url, book_title, book_author, magic_verified=True)
 
+            # Probe the first KiB in one ranged GET instead of a HEAD followed by a GET
+            try:
+                probe = self._probe(pdf_url)
             except requests.exceptions.RequestException:
-                # If HEAD request fails, try direct GET request
+                # If the probe fails, try a direct download
                 return self._download_pdf(pdf_url, book_title, book_author)
 
+            if probe['status_code'] not in (200, 206):
+                return False, None, f"PDF URL not accessible. Status code: {probe['status_code']}"
+
+            if not probe['looks_like_pdf']:
+                return False, None, f"URL does not point to a PDF file. Content-Type: {probe['content_type']}"
+
+            # Check content length
+            if probe['total_size'] and probe['total_size'] > self.max_file_size:
+                return False, None, f"File too large: {probe['total_size']} bytes"
+
+            return self._download_pdf(pdf_url, book_title, book_author, magic_verified=probe['has_pdf_magic'])
+
         except requests.exceptions.RequestException as e:
             return False, None, f"Network error: {str(e)}"
         except Exception as e:
             return False, None, f"Unexpected error: {str(e)}"
 
+    def _probe(self, url: str, timeout: int = 10) -> Dict:
+        """
+        Fetch only the first KiB of a URL with a ranged GET.
+
+        Returns:
+            Dict with status_code, content_type, total_size (None if unknown),
+            has_pdf_magic and looks_like_pdf
+        """
+        with self.session.get(url, headers={'Range': 'bytes=0-1023'}, timeout=timeout,
+                              stream=True, allow_redirects=True) as response:
+            content_type = response.headers.get('content-type', '').lower()
+
+            # 206 reports the full size after the slash in Content-Range; 200 means the range was ignored
+            total_size = None
+            content_range = response.headers.get('content-range', '')
+            if response.status_code == 206 and '/' in content_range:
+                total = content_range.rsplit('/', 1)[1]
+                total_size = int(total) if total.isdigit() else None
+            elif response.headers.get('content-length', '').isdigit():
+                total_size = int(response.headers['content-length'])
+
+            first_chunk = b''
+            if response.status_code in (200, 206):
+                first_chunk = response.raw.read(1024, decode_content=True)
+
+        has_pdf_magic = first_chunk.startswith(b'%PDF')
+        return {
+            'status_code': response.status_code,
+            'content_type': content_type,
+            'total_size': total_size,
+            'has_pdf_magic': has_pdf_magic,
+            'looks_like_pdf': has_pdf_magic or 'pdf' in content_type or 'application/octet-stream' in content_type,
+        }
+
     def _verify_pdf_only(self, pdf_url: str) -> Tuple[bool, None, Optional[str]]:
         """
         Verify that a PDF URL is accessible without downloading.
         Used for quick verification during search.
 
+        Definite answers are cached for a few minutes so repeated checks of the
+        same URL skip the network; network errors are not cached.
+
         Args:
             pdf_url: URL of the PDF to verify
 
         Returns:
             Tuple of (is_valid, None, error_message)
         """
+        cache_key = f"pdfverify:{hashlib.sha1(pdf_url.encode()).hexdigest()}"
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            # Try HEAD request first
-            try:
-                head_response = requests.head(pdf_url, headers=self.headers, timeout=5, allow_redirects=True)
+            probe = self._probe(pdf_url, timeout=5)
+
+            if probe['status_code'] not in (200, 206):
+                result = (False, None, f"Status code: {probe['status_code']}")
+            elif probe['looks_like_pdf']:
+                result = (True, None, None)
+            else:
+                result = (False, None, "Not a valid PDF file")
 
-                # If successful and content type is PDF, it's valid
-                content_type = head_response.headers.get('content-type', '').lower()
-                if head_response.status_code == 200 and ('pdf' in content_type or 'application/octet-stream' in content_type):
-                    return True, None, None
+        except Exception as e:
+            return False, None, f"Verification error: {str(e)}"
 
-                # If content type is not PDF, check with GET
-                if head_response.status_code == 200 and 'pdf' not in content_type:
-                    # Try a small GET request to check PDF signature
-                    get_response = requests.get(pdf_url, headers=self.headers, timeout=5, stream=True)
-                    first_chunk = next(get_response.iter_content(chunk_size=1024), b'')
-                    if first_chunk.startswith(b'%PDF'):
-                        return True, None, None
+        cache.set(cache_key, result, PDF_VERIFY_CACHE_TTL)
+        return result
+    
+    def verify_pdf_links(self, pdf_urls: List[str], max_workers: int = 8) -> List[Tuple[bool, None, Optional[str]]]:
+        """
+        Verify several PDF URLs concurrently over the pooled session.
 
-                    return False, None, "Not a valid PDF file"
+        Args:
+            pdf_urls: URLs to verify
+            max_workers: Maximum number of probes in flight at once
 
-                return False, None, f"Status code: {head_response.status_code}"
+        Returns:
+            List of _verify_pdf_only results in the same order as pdf_urls
+        """
+        if not pdf_urls:
+            return []
 
-            except requests.exceptions.RequestException:
-                # If HEAD fails, try GET
-                get_response = requests.get(pdf_url, headers=self.headers, timeout=5, stream=True)
-                if get_response.status_code == 200:
-                    first_chunk = next(get_response.iter_content(chunk_size=1024), b'')
-                    if first_chunk.startswith(b'%PDF'):
-                        return True, None, None
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(pdf_urls))) as executor:
+            return list(executor.map(self._verify_pdf_only, pdf_urls))
 
-                return False, None, "Failed to verify PDF"
+    def _download_to_file(self, url: str, file_obj) -> int:
+        """
+        Stream a URL into an open binary file in 64 KiB blocks.
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            requests.exceptions.RequestException: on network or HTTP errors
+            ValueError: if the file exceeds the size limit
+        """
+        with self.session.get(url, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+
+            while True:
+                chunk = response.raw.read(DOWNLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                file_obj.write(chunk)
+
+                if file_obj.tell() > self.max_file_size:
+                    raise ValueError(f"File too large: {file_obj.tell()} bytes")
+
+        return file_obj.tell()
 
-        except Exception as e:
-            return False, None, f"Verification error: {str(e)}"
-    
     def convert_epub_to_pdf(self, epub_url: str, book_title: str, book_author: str) -> Tuple[bool, Optional[str], Optional[str]]:
         """
         Download EPUB and convert it to PDF.
@@ -143,41 +334,27 @@ class PDFService:
         """
         
         try:
-            # Download EPUB file
-            response = requests.get(epub_url, headers=self.headers, timeout=self.timeout)
-            response.raise_for_status()
-            
-            # Create temporary files
-            with tempfile.NamedTemporaryFile(suffix='.epub', delete=False) as epub_temp:
-                epub_temp.write(response.content)
-                epub_temp_path = epub_temp.name
-            
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as pdf_temp:
-                pdf_temp_path = pdf_temp.name
-            
-            try:
+            # Everything lives in one temporary directory that is removed as a whole
+            with tempfile.TemporaryDirectory() as temp_dir:
+                epub_temp_path = os.path.join(temp_dir, 'in.epub')
+                pdf_temp_path = os.path.join(temp_dir, 'out.pdf')
+
+                # Download EPUB file straight to disk
+                with open(epub_temp_path, 'wb') as epub_file:
+                    self._download_to_file(epub_url, epub_file)
+                
                 # Convert EPUB to PDF
                 epub2pdf.convert(epub_temp_path, pdf_temp_path)
                 
-                # Read the converted PDF
-                with open(pdf_temp_path, 'rb') as pdf_file:
-                    pdf_content = pdf_file.read()
-                
-                # Save to Django storage
+                # Save to Django storage, which can move the converted file into place
                 filename = self._generate_filename(book_title, book_author, 'pdf')
-                file_path = default_storage.save(
-                    f'books/pdfs/{filename}',
-                    ContentFile(pdf_content)
-                )
+                with open(pdf_temp_path, 'rb') as pdf_file:
+                    file_path = default_storage.save(
+                        f'books/pdfs/{filename}',
+                        TemporaryPathFile(pdf_file)
+                    )
                 
                 return True, file_path, None
-                
-            finally:
-                # Clean up temporary files
-                if os.path.exists(epub_temp_path):
-                    os.unlink(epub_temp_path)
-                if os.path.exists(pdf_temp_path):
-                    os.unlink(pdf_temp_path)
                     
         except Exception as e:
             return False, None, f"EPUB to PDF conversion failed: {str(e)}"
@@ -196,16 +373,15 @@ class PDFService:
         """
         
         try:
-            # Download MOBI file
-            response = requests.get(mobi_url, headers=self.headers, timeout=self.timeout)
-            response.raise_for_status()
-            
-            # Create temporary files
-            with tempfile.NamedTemporaryFile(suffix='.mobi', delete=False) as mobi_temp:
-                mobi_temp.write(response.content)
-                mobi_temp_path = mobi_temp.name
-            
-            try:
+            # Everything lives in one temporary directory that is removed as a whole
+            with tempfile.TemporaryDirectory() as temp_dir:
+                mobi_temp_path = os.path.join(temp_dir, 'in.mobi')
+                pdf_temp_path = os.path.join(temp_dir, 'out.pdf')
+
+                # Download MOBI file straight to disk
+                with open(mobi_temp_path, 'wb') as mobi_file:
+                    self._download_to_file(mobi_url, mobi_file)
+                
                 # Extract text from MOBI
                 extracted_text, _ = mobi.extract(mobi_temp_path)
                 
@@ -215,50 +391,53 @@ class PDFService:
                 from reportlab.platypus import SimpleDocTemplate, Paragraph
                 from reportlab.lib.styles import getSampleStyleSheet
                 
-                with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as pdf_temp:
-                    pdf_temp_path = pdf_temp.name
-                
                 doc = SimpleDocTemplate(pdf_temp_path, pagesize=letter)
                 styles = getSampleStyleSheet()
+                title_style = styles['Title']
+                normal_style = styles['Normal']
                 story = []
                 
                 # Add title
-                title_style = styles['Title']
-                story.append(Paragraph(f"{book_title}", title_style))
+                story.append(Paragraph(escape(book_title or ''), title_style))
                 
                 if book_author:
-                    story.append(Paragraph(f"By: {book_author}", styles['Normal']))
+                    story.append(Paragraph(f"By: {escape(book_author)}", normal_style))
                 
-                # Add content
-                for line in extracted_text.split('\n'):
-                    if line.strip():
-                        story.append(Paragraph(line, styles['Normal']))
+                # Add content, escaped once and grouped into blocks so reportlab parses
+                # one Paragraph per block instead of one per line
+                lines = [escape(line) for line in extracted_text.split('\n') if line.strip()]
+                for start in range(0, len(lines), MOBI_LINES_PER_PARAGRAPH):
+                    block = lines[start:start + MOBI_LINES_PER_PARAGRAPH]
+                    story.append(Paragraph('<br/>'.join(block), normal_style))
                 
                 doc.build(story)
                 
-                # Read the converted PDF
-                with open(pdf_temp_path, 'rb') as pdf_file:
-                    pdf_content = pdf_file.read()
-                
-                # Save to Django storage
+                # Save to Django storage, which can move the converted file into place
                 filename = self._generate_filename(book_title, book_author, 'pdf')
-                file_path = default_storage.save(
-                    f'books/pdfs/{filename}',
-                    ContentFile(pdf_content)
-                )
+                with open(pdf_temp_path, 'rb') as pdf_file:
+                    file_path = default_storage.save(
+                        f'books/pdfs/{filename}',
+                        TemporaryPathFile(pdf_file)
+                    )
                 
                 return True, file_path, None
-                
-            finally:
-                # Clean up temporary files
-                if os.path.exists(mobi_temp_path):
-                    os.unlink(mobi_temp_path)
-                if 'pdf_temp_path' in locals() and os.path.exists(pdf_temp_path):
-                    os.unlink(pdf_temp_path)
                     
         except Exception as e:
             return False, None, f"MOBI to PDF conversion failed: {str(e)}"
     
+    def detect_file_type(self, file_url: str) -> Optional[str]:
+        """Guess the book file type ('pdf', 'epub' or 'mobi') from its URL, or None."""
+        # One scan of the lowercased URL; PDF wins over EPUB, which wins over MOBI
+        found = set(FILE_TYPE_RE.findall(file_url.lower()))
+        for file_type in ('pdf', 'epub', 'mobi'):
+            if file_type in found:
+                return file_type
+        return None
+
+    def needs_conversion(self, file_url: str) -> bool:
+        """Whether the file at this URL has to be converted to PDF (slow, run in background)."""
+        return bool(file_url) and self.detect_file_type(file_url) in ('epub', 'mobi')
+
     def process_book_file(self, file_url: str, book_title: str, book_author: str) -> Dict:
         """
         Process a book file URL, determining its type and handling accordingly.
@@ -281,126 +460,196 @@ class PDFService:
             }
         
         # Determine file type from URL
-        parsed_url = urlparse(file_url.lower())
-        path = parsed_url.path
+        file_type = self.detect_file_type(file_url)
+        handlers = {
+            'pdf': (self.verify_and_download_pdf, 'pdf'),
+            'epub': (self.convert_epub_to_pdf, 'epub_converted'),
+            'mobi': (self.convert_mobi_to_pdf, 'mobi_converted'),
+        }
         
-        if path.endswith('.pdf') or 'pdf' in file_url.lower():
-            # Direct PDF
-            success, file_path, error = self.verify_and_download_pdf(file_url, book_title, book_author)
+        if file_type:
+            # PDF is downloaded directly, EPUB/MOBI are converted to PDF
+            handler, result_type = handlers[file_type]
+            success, file_path, error = handler(file_url, book_title, book_author)
             return {
                 'success': success,
                 'file_path': file_path,
-                'file_type': 'pdf',
+                'file_type': result_type,
                 'error': error
             }
         
-        elif path.endswith('.epub') or 'epub' in file_url.lower():
-            # EPUB - convert to PDF
-            success, file_path, error = self.convert_epub_to_pdf(file_url, book_title, book_author)
+        # Unknown format - sniff the leading bytes once to shortcut the recognisable cases
+        try:
+            file_format = self._sniff_format(file_url)
+        except requests.exceptions.RequestException:
+            file_format = 'unknown'
+
+        if file_format in ('epub', 'mobi'):
+            handler, result_type = handlers[file_format]
+            success, file_path, error = handler(file_url, book_title, book_author)
             return {
                 'success': success,
                 'file_path': file_path,
-                'file_type': 'epub_converted',
+                'file_type': result_type,
                 'error': error
             }
-        
-        elif path.endswith('.mobi') or 'mobi' in file_url.lower():
-            # MOBI - convert to PDF
-            success, file_path, error = self.convert_mobi_to_pdf(file_url, book_title, book_author)
+
+        # Otherwise try it as a PDF; a confirmed signature skips the verification probe and final check
+        success, file_path, error = self.verify_and_download_pdf(
+            file_url, book_title, book_author, magic_verified=file_format == 'pdf'
+        )
+        if success:
             return {
-                'success': success,
+                'success': True,
                 'file_path': file_path,
-                'file_type': 'mobi_converted',
-                'error': error
+                'file_type': 'pdf',
+                'error': None
             }
-        
-        else:
-            # Unknown format - try as PDF first
-            success, file_path, error = self.verify_and_download_pdf(file_url, book_title, book_author)
-            if success:
-                return {
-                    'success': True,
-                    'file_path': file_path,
-                    'file_type': 'pdf',
-                    'error': None
-                }
-            else:
-                return {
-                    'success': False,
-                    'file_path': None,
-                    'file_type': 'unknown',
-                    'error': f'Unknown file format and PDF verification failed: {error}'
-                }
-    
-    def _download_pdf(self, pdf_url: str, book_title: str, book_author: str) -> Tuple[bool, Optional[str], Optional[str]]:
-        """Download PDF file and save to storage."""
+
+        return {
+            'success': False,
+            'file_path': None,
+            'file_type': 'unknown',
+            'error': f'Unknown file format and PDF verification failed: {error}'
+        }
+
+    def _sniff_format(self, url: str) -> str:
+        """
+        Identify a book file from its first 128 bytes with a single ranged GET.
+
+        Returns:
+            'pdf', 'epub', 'mobi' or 'unknown'
+        """
+        with self.session.get(url, headers={'Range': 'bytes=0-127'}, timeout=10, stream=True) as response:
+            if response.status_code not in (200, 206):
+                return 'unknown'
+            head = response.raw.read(128, decode_content=True)
+
+        if head.startswith(b'%PDF'):
+            return 'pdf'
+        if head.startswith(b'PK\x03\x04') and b'application/epub+zip' in head:
+            return 'epub'
+        if head[60:68] == b'BOOKMOBI':
+            return 'mobi'
+        return 'unknown'
+
+    def process_book_files(self, books: List[Dict], max_workers: int = 8) -> List[Dict]:
+        """
+        Process several book files concurrently so their downloads overlap.
+
+        Args:
+            books: List of dicts with 'file_url', 'book_title' and 'book_author' keys
+            max_workers: Maximum number of files processed at the same time
+
+        Returns:
+            List of processing results in the same order as books
+        """
+        if not books:
+            return []
+
+        def process(book):
+            return self.process_book_file(book.get('file_url'), book.get('book_title', ''), book.get('book_author', ''))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(books))) as executor:
+            return list(executor.map(process, books))
+
+    def _download_pdf(self, pdf_url: str, book_title: str, book_author: str, magic_verified: bool = False) -> Tuple[bool, Optional[str], Optional[str]]:
+        """
+        Download PDF file and save to storage, streaming it through a temporary file.
+        Interrupted transfers are resumed with a Range request when the server allows it.
+        A 416 on a resume either confirms the file is already complete or restarts it from byte 0.
+
+        magic_verified tells the download that a probe already saw the %PDF signature,
+        so the final signature check can be skipped.
+        """
         try:
-            response = requests.get(pdf_url, headers=self.headers, timeout=self.timeout, stream=True)
-            response.raise_for_status()
-            
-            # Check if response is actually a PDF
-            content_type = response.headers.get('content-type', '').lower()
-            if 'pdf' not in content_type and 'application/octet-stream' not in content_type:
-                # Check first few bytes for PDF signature
-                first_chunk = next(response.iter_content(chunk_size=1024), b'')
-                if not first_chunk.startswith(b'%PDF'):
+            with tempfile.TemporaryDirectory() as temp_dir, open(os.path.join(temp_dir, 'download.pdf'), 'w+b') as pdf_temp:
+                validator = None
+
+                for attempt in range(DOWNLOAD_ATTEMPTS):
+                    headers = {}
+                    if validator and pdf_temp.tell():
+                        # Ask only for the missing bytes, unless the file changed in the meantime
+                        headers = {'Range': f'bytes={pdf_temp.tell()}-', 'If-Range': validator}
+
+                    try:
+                        with self.session.get(pdf_url, headers=headers, timeout=self.timeout, stream=True) as response:
+                            if response.status_code == 416 and pdf_temp.tell():
+                                # The dropped attempt may already have written every byte
+                                total_size = response.headers.get('content-range', '').rpartition('/')[2]
+                                if total_size == str(pdf_temp.tell()):
+                                    break
+                                if attempt < DOWNLOAD_ATTEMPTS - 1:
+                                    # Otherwise the saved bytes are unusable: start over
+                                    pdf_temp.seek(0)
+                                    pdf_temp.truncate()
+                                    validator = None
+                                    continue
+                            response.raise_for_status()
+                            response.raw.decode_content = True
+
+                            if response.status_code != 206 and pdf_temp.tell():
+                                # Range was ignored or the file changed: start over
+                                pdf_temp.seek(0)
+                                pdf_temp.truncate()
+
+                            if not pdf_temp.tell():
+                                # Byte offsets are only meaningful for unencoded bodies
+                                if not response.headers.get('content-encoding'):
+                                    validator = response.headers.get('etag') or response.headers.get('last-modified')
+
+                                # Check if response is actually a PDF
+                                content_type = response.headers.get('content-type', '').lower()
+                                if 'pdf' not in content_type and 'application/octet-stream' not in content_type:
+                                    # Check first few bytes for PDF signature
+                                    first_chunk = response.raw.read(1024)
+                                    if not first_chunk.startswith(b'%PDF'):
+                                        return False, None, "Downloaded content is not a valid PDF"
+                                    magic_verified = True
+                                    pdf_temp.write(first_chunk)
+
+                            # Copy the body to disk in 64 KiB blocks so memory stays flat
+                            while True:
+                                chunk = response.raw.read(DOWNLOAD_CHUNK_SIZE)
+                                if not chunk:
+                                    break
+                                pdf_temp.write(chunk)
+
+                                # Check size limit
+                                if pdf_temp.tell() > self.max_file_size:
+                                    return False, None, f"File too large: {pdf_temp.tell()} bytes"
+                        break
+
+                    except RESUMABLE_ERRORS:
+                        if attempt == DOWNLOAD_ATTEMPTS - 1:
+                            raise
+                        time.sleep(DOWNLOAD_BACKOFF_BASE * (2 ** attempt))
+
+                # Verify it's a valid PDF, unless the signature was already seen
+                pdf_temp.seek(0)
+                if not magic_verified and pdf_temp.read(4) != b'%PDF':
                     return False, None, "Downloaded content is not a valid PDF"
-            
-            # Download the file
-            content = b''
-            total_size = 0
-            
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    content += chunk
-                    total_size += len(chunk)
-                    
-                    # Check size limit
-                    if total_size > self.max_file_size:
-                        return False, None, f"File too large: {total_size} bytes"
-            
-            # Verify it's a valid PDF
-            if not content.startswith(b'%PDF'):
-                return False, None, "Downloaded content is not a valid PDF"
-            
-            # Generate filename and save
-            filename = self._generate_filename(book_title, book_author, 'pdf')
-            file_path = default_storage.save(
-                f'books/pdfs/{filename}',
-                ContentFile(content)
-            )
-            
+                pdf_temp.seek(0)
+                pdf_temp.flush()
+
+                # Generate filename and save; file system storage moves the download into place
+                filename = self._generate_filename(book_title, book_author, 'pdf')
+                file_path = default_storage.save(
+                    f'books/pdfs/{filename}',
+                    TemporaryPathFile(pdf_temp)
+                )
+
             return True, file_path, None
-            
-        except requests.exceptions.RequestException as e:
+
+        except (requests.exceptions.RequestException, ProtocolError, ReadTimeoutError) as e:
             return False, None, f"Download failed: {str(e)}"
         except Exception as e:
             return False, None, f"Unexpected error during download: {str(e)}"
-    
+
     def _generate_filename(self, title: str, author: str, extension: str) -> str:
         """Generate a safe filename for the book."""
-        # Clean title and author
-        safe_title = self._clean_filename(title)
-        safe_author = self._clean_filename(author) if author else "unknown"
-        
-        # Limit length
-        safe_title = safe_title[:50]
-        safe_author = safe_author[:30]
-        
-        return f"{safe_title}_{safe_author}.{extension}"
+        return generate_filename(title, author, extension)
     
     def _clean_filename(self, text: str) -> str:
         """Clean text to be safe for use in filenames."""
-        if not text:
-            return "unknown"
-        
-        # Replace problematic characters
-        safe_chars = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_"
-        cleaned = ''.join(c if c in safe_chars else '_' for c in text)
-        
-        # Remove multiple underscores
-        while '__' in cleaned:
-            cleaned = cleaned.replace('__', '_')
-        
-        return cleaned.strip('_')
-
+        return clean_filename(text)
@@ -1,3 +1,292 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+import httpx
+import requests
+from django.test import SimpleTestCase
+from requests.structures import CaseInsensitiveDict
+from urllib3.exceptions import ProtocolError
+
+from .services import llm_service, pdf_service
+from .services.llm_service import (
+    GROQ_BACKOFF_BASE, GROQ_BREAKER_COOLDOWN, GROQ_BREAKER_FAILURES, GROQ_BREAKER_WINDOW, GROQ_MAX_BACKOFF,
+    CircuitBreaker, LLMService, RateLimitError, TokenBucket,
+)
+from .services.pdf_service import PDFService
+from .views import is_valid_social_link
+
+
+class FakeClock:
+    """Stands in for time.monotonic and time.sleep so timing logic runs instantly."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def rate_limit_error(retry_after=None):
+    headers = {'retry-after': retry_after} if retry_after is not None else {}
+    response = httpx.Response(429, headers=headers, request=httpx.Request('POST', 'https://api.groq.com'))
+    return RateLimitError('Rate limit reached', response=response, body=None)
+
+
+class IsValidSocialLinkTests(SimpleTestCase):
+    """Tests for the social media link validation used on website lookups."""
+
+    def test_accepts_profile_link(self):
+        self.assertTrue(is_valid_social_link('https://www.youtube.com/netflix', 'youtube', 'Netflix'))
+
+    def test_accepts_link_without_scheme(self):
+        self.assertTrue(is_valid_social_link('youtube.com/netflix', 'youtube', 'Netflix'))
+        self.assertTrue(is_valid_social_link('www.instagram.com/netflix', 'instagram', 'Netflix'))
+
+    def test_rejects_other_host_without_scheme(self):
+        self.assertFalse(is_valid_social_link('example.com/youtube.com/netflix', 'youtube', 'Netflix'))
+
+    def test_rejects_non_http_scheme(self):
+        self.assertFalse(is_valid_social_link('ftp://youtube.com/netflix', 'youtube', 'Netflix'))
+
+    def test_rejects_content_link(self):
+        self.assertFalse(is_valid_social_link('twitter.com/netflix/status/1', 'twitter', 'Netflix'))
+
+
+class TokenBucketTests(SimpleTestCase):
+    """Tests for the token bucket that paces Groq requests."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        for name in ('monotonic', 'sleep'):
+            patcher = mock.patch.object(llm_service.time, name, getattr(self.clock, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_starts_full(self):
+        bucket = TokenBucket(3, 60.0)
+        for _ in range(3):
+            bucket.acquire()
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_refills_over_time(self):
+        bucket = TokenBucket(3, 60.0)
+        for _ in range(3):
+            bucket.acquire()
+
+        self.clock.now += 20.0  # one token's worth at 3 per minute
+        bucket.acquire()
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_waits_for_the_next_token_when_empty(self):
+        bucket = TokenBucket(3, 60.0)
+        for _ in range(3):
+            bucket.acquire()
+
+        bucket.acquire()
+        self.assertEqual(len(self.clock.sleeps), 1)
+        self.assertAlmostEqual(self.clock.sleeps[0], 20.0)
+
+
+class CircuitBreakerTests(SimpleTestCase):
+    """Tests for the circuit breaker in front of Groq."""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        for name in ('monotonic', 'sleep'):
+            patcher = mock.patch.object(llm_service.time, name, getattr(self.clock, name))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.breaker = CircuitBreaker(GROQ_BREAKER_FAILURES, GROQ_BREAKER_WINDOW, GROQ_BREAKER_COOLDOWN)
+
+    def test_opens_after_failures_within_window(self):
+        for _ in range(GROQ_BREAKER_FAILURES - 1):
+            self.breaker.record_failure()
+            self.assertTrue(self.breaker.allow())
+
+        self.breaker.record_failure()
+        self.assertFalse(self.breaker.allow())
+
+    def test_failures_outside_window_do_not_open(self):
+        for _ in range(GROQ_BREAKER_FAILURES - 1):
+            self.breaker.record_failure()
+        self.clock.now += GROQ_BREAKER_WINDOW + 1
+
+        self.breaker.record_failure()
+        self.assertTrue(self.breaker.allow())
+
+    def test_half_open_after_cooldown(self):
+        for _ in range(GROQ_BREAKER_FAILURES):
+            self.breaker.record_failure()
+
+        self.clock.now += GROQ_BREAKER_COOLDOWN
+        self.assertTrue(self.breaker.allow())
+
+        # The trial request fails on its own, which is not enough to reopen the breaker
+        self.breaker.record_failure()
+        self.assertTrue(self.breaker.allow())
+
+    def test_success_resets_failure_count(self):
+        for _ in range(GROQ_BREAKER_FAILURES - 1):
+            self.breaker.record_failure()
+        self.breaker.record_success()
+
+        self.breaker.record_failure()
+        self.assertTrue(self.breaker.allow())
+
+    def test_rate_limits_do_not_count(self):
+        service = LLMService.__new__(LLMService)
+        service.model = 'test-model'
+        service.client = mock.Mock()
+        service.client.chat.completions.create.side_effect = rate_limit_error('1')
+
+        with mock.patch.object(llm_service, 'groq_circuit_breaker', self.breaker), \
+                mock.patch.object(llm_service.groq_rate_limiter, 'acquire'):
+            with self.assertRaises(RateLimitError):
+                service._call_groq(messages=[])
+
+        self.assertGreater(service.client.chat.completions.create.call_count, GROQ_BREAKER_FAILURES)
+        self.assertTrue(self.breaker.allow())
+
+
+class RetryDelayTests(SimpleTestCase):
+    """Tests for the wait between Groq retries."""
+
+    def test_uses_retry_after(self):
+        self.assertEqual(LLMService._retry_delay(rate_limit_error('3'), 0), 3.0)
+
+    def test_caps_retry_after(self):
+        self.assertEqual(LLMService._retry_delay(rate_limit_error('120'), 0), GROQ_MAX_BACKOFF)
+
+    def test_backs_off_exponentially_without_retry_after(self):
+        with mock.patch.object(llm_service.random, 'random', return_value=0.0):
+            self.assertEqual(LLMService._retry_delay(rate_limit_error(), 0), GROQ_BACKOFF_BASE)
+            self.assertEqual(LLMService._retry_delay(rate_limit_error(), 2), GROQ_BACKOFF_BASE * 4)
+
+    def test_caps_backoff(self):
+        self.assertEqual(LLMService._retry_delay(rate_limit_error(), 10), GROQ_MAX_BACKOFF)
+
+    def test_ignores_http_date_retry_after(self):
+        with mock.patch.object(llm_service.random, 'random', return_value=0.0):
+            delay = LLMService._retry_delay(rate_limit_error('Wed, 21 Oct 2026 07:28:00 GMT'), 1)
+        self.assertEqual(delay, GROQ_BACKOFF_BASE * 2)
+
+
+class FakeRaw:
+    """Raw body stream that can drop the connection after a given number of bytes."""
+
+    def __init__(self, body, fail_after=None):
+        self.body = body
+        self.pos = 0
+        self.fail_after = fail_after
+        self.decode_content = False
+
+    def read(self, size):
+        if self.fail_after is not None and self.pos >= self.fail_after:
+            raise ProtocolError('Connection broken: IncompleteRead')
+        end = self.pos + size if self.fail_after is None else min(self.pos + size, self.fail_after)
+        chunk = self.body[self.pos:end]
+        self.pos = end
+        return chunk
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=b'', headers=None, fail_after=None):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.raw = FakeRaw(body, fail_after)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f'{self.status_code} Error')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class DownloadPdfResumeTests(SimpleTestCase):
+    """Tests for resuming interrupted PDF downloads with Range/If-Range."""
+
+    body = b'%PDF-1.4\n' + bytes(range(256)) * 800
+    pdf_headers = {'Content-Type': 'application/pdf', 'ETag': '"v1"'}
+
+    def setUp(self):
+        self.service = PDFService()
+        self.service.session = mock.Mock()
+        self.saved = []
+
+        def save(name, content):
+            self.saved.append(content.read())
+            return name
+
+        for patcher in (
+            mock.patch.object(pdf_service.time, 'sleep'),
+            mock.patch.object(pdf_service, 'default_storage', mock.Mock(save=mock.Mock(side_effect=save))),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def download(self, *responses):
+        self.service.session.get.side_effect = list(responses)
+        return self.service._download_pdf('https://example.org/book', 'Title', 'Author')
+
+    def request_headers(self):
+        return [call.kwargs['headers'] for call in self.service.session.get.call_args_list]
+
+    def test_resumes_with_range_after_failure_mid_body(self):
+        cut = 100000
+        success, file_path, error = self.download(
+            FakeResponse(200, self.body, self.pdf_headers, fail_after=cut),
+            FakeResponse(206, self.body[cut:], self.pdf_headers),
+        )
+
+        self.assertTrue(success, error)
+        self.assertEqual(self.saved, [self.body])
+        self.assertEqual(self.request_headers()[1], {'Range': f'bytes={cut}-', 'If-Range': '"v1"'})
+
+    def test_rewinds_when_range_is_ignored(self):
+        success, file_path, error = self.download(
+            FakeResponse(200, self.body, self.pdf_headers, fail_after=100000),
+            FakeResponse(200, self.body, self.pdf_headers),
+        )
+
+        self.assertTrue(success, error)
+        self.assertEqual(self.saved, [self.body])
+
+    def test_does_not_resume_content_encoded_body(self):
+        headers = {**self.pdf_headers, 'Content-Encoding': 'gzip'}
+        success, file_path, error = self.download(
+            FakeResponse(200, self.body, headers, fail_after=100000),
+            FakeResponse(200, self.body, headers),
+        )
+
+        self.assertTrue(success, error)
+        self.assertEqual(self.saved, [self.body])
+        self.assertEqual(self.request_headers()[1], {})
+
+    def test_accepts_complete_file_on_416(self):
+        size = len(self.body)
+        success, file_path, error = self.download(
+            FakeResponse(200, self.body, self.pdf_headers, fail_after=size),
+            FakeResponse(416, headers={'Content-Range': f'bytes */{size}'}),
+        )
+
+        self.assertTrue(success, error)
+        self.assertEqual(self.saved, [self.body])
+
+    def test_restarts_on_416_when_size_differs(self):
+        success, file_path, error = self.download(
+            FakeResponse(200, self.body, self.pdf_headers, fail_after=100000),
+            FakeResponse(416, headers={'Content-Range': f'bytes */{len(self.body) + 10}'}),
+            FakeResponse(200, self.body, self.pdf_headers),
+        )
+
+        self.assertTrue(success, error)
+        self.assertEqual(self.saved, [self.body])
+        self.assertEqual(self.request_headers()[2], {})
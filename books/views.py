@@ -3,22 +3,204 @@
 Django API views for AI-powered book addition functionality.
 """
 
+import hashlib
+import logging
+import re
 import uuid
 import json
 import concurrent.futures
+import copy
+import functools
+import threading
+import time
+from datetime import datetime
+from urllib.parse import quote_plus, urlsplit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import close_old_connections
+from django.db.models import Q
 from django.shortcuts import get_object_or_404
-from django.utils import timezone
 from .models import Book, BookSearchResult
-from .services.llm_service import LLMService
+from .services.llm_service import get_llm_service
 from .services.external_apis import ExternalAPIsService
-from .services.pdf_service import PDFService
+from .services.pdf_service import PDFService, conversion_executor
 from .serializers import BookSerializer, BookSearchResultSerializer
 
 
+logger = logging.getLogger(__name__)
+
+# Browser User-Agent so Google serves the regular image results page
+IMAGE_SEARCH_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# (connect, read) timeouts for scraping requests made from these views
+EXTERNAL_HTTP_TIMEOUT = (settings.EXTERNAL_HTTP_CONNECT_TIMEOUT, settings.EXTERNAL_HTTP_READ_TIMEOUT)
+
+# Image URL validation, compiled once instead of scanning domain lists on every call
+MAX_IMAGE_URL_LENGTH = 500  # longer URLs are often problematic
+WIKIMEDIA_DOMAIN_RE = re.compile(r'wikimedia\.org|wikipedia\.org', re.IGNORECASE)
+RELIABLE_IMAGE_DOMAIN_RE = re.compile(
+    r'placehold\.co'           # Reliable placeholder service
+    r'|dummyimage\.com'        # Another reliable placeholder service
+    r'|logo\.clearbit\.com'    # Usually works for company logos
+    r'|cdn\.britannica\.com'   # Britannica images are very reliable
+    r'|images\.unsplash\.com'  # Unsplash (but only direct image URLs)
+    r'|cdn\.pixabay\.com'      # Pixabay CDN
+    r'|images\.pexels\.com',   # Pexels images
+    re.IGNORECASE
+)
+BLOCKED_GOOGLE_IMAGE_DOMAIN_RE = re.compile(
+    r'wikimedia\.org|wikipedia\.org|google\.com|googleusercontent\.com|gstatic\.com'
+    r'|encrypted-tbn',  # Google's encrypted thumbnails
+    re.IGNORECASE
+)
+HTTP_URL_RE = re.compile(r'https?://', re.IGNORECASE)
+IMAGE_EXTENSION_RE = re.compile(r'\.(?:jpg|jpeg|png|webp|gif|svg)\Z', re.IGNORECASE)
+GOOGLE_IMAGE_EXTENSION_RE = re.compile(r'\.(?:jpg|jpeg|png|webp|gif)\Z', re.IGNORECASE)
+
+# Image URLs embedded in the Google Images results page; the lookahead skips quoted
+# URLs from blocked domains so matches only need the length check afterwards
+GOOGLE_IMAGE_URL_RE = re.compile(
+    rb'"(?![^"]*(?:' + BLOCKED_GOOGLE_IMAGE_DOMAIN_RE.pattern.encode() + rb'))'
+    rb'(https?://[^"]*\.(?:jpg|jpeg|png|webp|gif))"',
+    re.IGNORECASE
+)
+GOOGLE_IMAGE_SCAN_CHUNK = 16 * 1024
+GOOGLE_IMAGE_SCAN_OVERLAP = 2048  # longer than any URL MAX_IMAGE_URL_LENGTH allows
+
+IMAGE_SEARCH_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Website/author/category/company profiles from the LLM change rarely
+LLM_LOOKUP_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# verify_pdf_link answers (kept apart from PDFService's own verification cache):
+# confirmed links are rechecked hourly, broken ones after a few minutes
+PDF_LINK_CHECK_CACHE_TTL = 60 * 60  # seconds
+PDF_LINK_CHECK_FAILURE_CACHE_TTL = 5 * 60  # seconds
+
+# Book listing totals may lag behind new books by up to this long
+BOOK_COUNT_CACHE_TTL = 60  # seconds
+
+# Curated images from reliable sources, used when Google Images finds nothing
+AUTHOR_FALLBACK_IMAGES = {
+    "jane austen": "https://cdn.britannica.com/12/172012-050-DAA7CE2B/Jane-Austen-watercolour-Cassandra-Austen-1810.jpg",
+    "shakespeare": "https://cdn.britannica.com/51/1851-050-7A4E6C35/William-Shakespeare.jpg",
+    "stephen king": "https://cdn.britannica.com/34/206034-050-BBCF8C8A/Stephen-King-2019.jpg",
+    "agatha christie": "https://cdn.britannica.com/30/9230-050-0A4D3C80/Agatha-Christie-1925.jpg",
+    "mark twain": "https://cdn.britannica.com/13/153413-050-2B899E58/Mark-Twain-1907.jpg",
+}
+CATEGORY_FALLBACK_IMAGES = {
+    "entertainment": "https://cdn.britannica.com/60/182360-050-CD8878D6/scene-Citizen-Kane-Orson-Welles-1941.jpg",
+    "technology": "https://cdn.britannica.com/69/155469-050-3F458ECF/circuit-board-computer.jpg",
+    "business": "https://cdn.britannica.com/77/170477-050-1C747EE3/Nasdaq-MarketSite-Times-Square-New-York-City.jpg",
+    "education": "https://cdn.britannica.com/07/192107-050-7C9F98E8/Harvard-University-Cambridge-Massachusetts.jpg",
+    "science": "https://cdn.britannica.com/86/193986-050-7C6DE899/laboratory-glassware.jpg",
+    "health": "https://cdn.britannica.com/17/196817-050-6A15DAC3/stethoscope.jpg",
+    "finance": "https://cdn.britannica.com/78/170478-050-1C747EE3/New-York-Stock-Exchange-Wall-Street.jpg",
+    "sports": "https://cdn.britannica.com/63/114163-050-7745C043/Soccer-ball-goal.jpg",
+}
+
+_image_search_session = None
+
+# Website/author/category lookups currently in progress, keyed by function and normalized name
+inflight_lookups = {}
+inflight_lookups_lock = threading.Lock()
+
+
+def get_image_search_session() -> requests.Session:
+    """Return the pooled session used for image searches, creating it on first use."""
+    global _image_search_session
+    if _image_search_session is None:
+        session = requests.Session()
+        # Retry a failed connect once and transient gateway errors twice with backoff;
+        # a stalled read falls through to the curated fallback
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=None,
+                connect=1,
+                read=0,
+                status=2,
+                redirect=False,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=['GET']
+            )
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update(IMAGE_SEARCH_HEADERS)
+        _image_search_session = session
+    return _image_search_session
+
+
+def normalize_lookup_name(name: str) -> str:
+    """Normalize an entity name so case and spacing variants share one lookup."""
+    return ' '.join((name or '').lower().split())
+
+
+def cache_entity_lookups(func):
+    """
+    Cache website/author/category lookups by normalized name and language.
+    Fallback results, tagged with '_fallback' by the lookup, are returned untagged and not cached.
+    """
+    @functools.wraps(func)
+    def wrapper(name: str, language: str = 'en') -> dict:
+        name_hash = hashlib.sha1(normalize_lookup_name(name).encode()).hexdigest()
+        cache_key = f"lookup:{func.__name__}:{language}:{name_hash}"
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = func(name, language)
+        if not result.pop('_fallback', False):
+            cache.set(cache_key, result, LLM_LOOKUP_CACHE_TTL)
+        return result
+
+    return wrapper
+
+
+def coalesce_inflight_lookups(func):
+    """
+    Share one LLM lookup between concurrent calls for the same name and language.
+    Callers that join a lookup already in progress get their own copy of its result.
+    """
+    @functools.wraps(func)
+    def wrapper(name: str, language: str = 'en') -> dict:
+        key = (func.__name__, normalize_lookup_name(name), language)
+        with inflight_lookups_lock:
+            future = inflight_lookups.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = concurrent.futures.Future()
+                inflight_lookups[key] = future
+
+        if not is_owner:
+            return copy.deepcopy(future.result())
+
+        try:
+            result = func(name, language)
+            future.set_result(copy.deepcopy(result))
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with inflight_lookups_lock:
+                inflight_lookups.pop(key, None)
+
+    return wrapper
+
+
 def is_valid_image_url(url: str) -> bool:
     """
     Validates if a given URL is a reliable image URL that actually works.
@@ -28,53 +210,34 @@ def is_valid_image_url(url: str) -> bool:
         return False
 
     # REJECT ALL WIKIMEDIA URLS COMPLETELY - they cause too many issues
-    wikimedia_domains = [
-        'wikimedia.org',
-        'wikipedia.org'
-    ]
-
-    url_lower = url.lower()
-    if any(domain in url_lower for domain in wikimedia_domains):
-        print(f"Rejecting Wikimedia URL: {url}")
+    if WIKIMEDIA_DOMAIN_RE.search(url):
+        logger.debug("Rejecting Wikimedia URL: %s", url)
         return False
 
     # Must start with http/https
-    if not url_lower.startswith(('http://', 'https://')):
-        print(f"Rejecting non-HTTP URL: {url}")
+    if not HTTP_URL_RE.match(url):
+        logger.debug("Rejecting non-HTTP URL: %s", url)
         return False
 
     # Accept URLs from reliable sources
-    reliable_domains = [
-        'placehold.co',         # Reliable placeholder service
-        'dummyimage.com',       # Another reliable placeholder service
-        'logo.clearbit.com',    # Usually works for company logos
-        'cdn.britannica.com',   # Britannica images are very reliable
-        'images.unsplash.com',  # Unsplash (but only direct image URLs)
-        'cdn.pixabay.com',      # Pixabay CDN
-        'images.pexels.com',    # Pexels images
-        'upload.wikimedia.org', # Wikimedia direct image URLs (not file pages)
-    ]
-
-    # If it's from a reliable domain, accept it
-    if any(domain in url_lower for domain in reliable_domains):
-        # Special check for Wikimedia - only accept direct image URLs
-        if 'wikimedia.org' in url_lower:
-            return url_lower.endswith(('.jpg', '.jpeg', '.png', '.webp', '.gif', '.svg'))
+    if RELIABLE_IMAGE_DOMAIN_RE.search(url):
         return True
 
     # For other domains, must end with a common image extension
-    if not url_lower.endswith((".jpg", ".jpeg", ".png", ".webp", ".gif", ".svg")):
-        print(f"Rejecting non-image URL from untrusted domain: {url}")
+    if not IMAGE_EXTENSION_RE.search(url):
+        logger.debug("Rejecting non-image URL from untrusted domain: %s", url)
         return False
 
     # Reject URLs that are too long (often problematic)
-    if len(url) > 500:
-        print(f"Rejecting overly long URL: {url[:100]}...")
+    if len(url) > MAX_IMAGE_URL_LENGTH:
+        logger.debug("Rejecting overly long URL: %.100s...", url)
         return False
 
     # Additional check: reject URLs with too many query parameters
-    if url.count('?') > 1 or url.count('&') > 5:
-        print(f"Rejecting URL with too many parameters: {url}")
+    # ('&' only separates parameters once there is a query string, so skip counting otherwise)
+    query_marks = url.count('?')
+    if query_marks > 1 or (query_marks and url.count('&') > 5):
+        logger.debug("Rejecting URL with too many parameters: %s", url)
         return False
 
     return True
@@ -86,11 +249,7 @@ def search_google_images(query: str, image_type: str = "general") -> str:
     Returns the first valid image URL found.
     """
     try:
-        import requests
-        from urllib.parse import quote_plus
-        import re
-
-        print(f"Searching Google Images for: {query} ({image_type})")
+        logger.debug("Searching Google Images for: %s (%s)", query, image_type)
 
         # Prepare search query
         search_query = f"{query} {image_type}" if image_type != "general" else query
@@ -99,31 +258,35 @@ def search_google_images(query: str, image_type: str = "general") -> str:
         # Google Images search URL
         search_url = f"https://www.google.com/search?q={encoded_query}&tbm=isch&safe=active"
 
-        # Headers to mimic a real browser
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-
-        # Make request to Google Images
-        response = requests.get(search_url, headers=headers, timeout=10)
-
-        if response.status_code == 200:
-            # Extract image URLs from the response
-            # Look for image URLs in the HTML
-            image_pattern = r'"(https?://[^"]*\.(?:jpg|jpeg|png|webp|gif))"'
-            matches = re.findall(image_pattern, response.text, re.IGNORECASE)
-
-            # Filter out unwanted domains and find a good image
-            for url in matches:
-                if is_valid_google_image_url(url):
-                    print(f"Found valid Google image: {url}")
-                    return url
+        # Make request to Google Images over the shared keep-alive session
+        with get_image_search_session().get(search_url, timeout=EXTERNAL_HTTP_TIMEOUT, stream=True) as response:
+            if response.status_code == 200:
+                # Scan the HTML as it arrives and stop at the first usable image URL,
+                # usually found well before the end of the page
+                buffer = b''
+                for chunk in response.iter_content(chunk_size=GOOGLE_IMAGE_SCAN_CHUNK):
+                    buffer += chunk
+                    scanned_to = 0
+                    for match in GOOGLE_IMAGE_URL_RE.finditer(buffer):
+                        scanned_to = match.end()
+                        url = match.group(1).decode('utf-8', 'replace')
+                        # The pattern already enforces the extension and domain rules
+                        if len(url) <= MAX_IMAGE_URL_LENGTH:
+                            logger.debug("Found valid Google image: %s", url)
+                            return url
+
+                    # Carry over the unscanned tail in case a URL is split across chunks
+                    buffer = buffer[max(scanned_to, len(buffer) - GOOGLE_IMAGE_SCAN_OVERLAP):]
 
         # If Google search fails, fall back to curated images
         return get_fallback_image(query, image_type)
 
+    except requests.exceptions.ConnectTimeout:
+        logger.warning("Google Images unreachable within %ss, using fallback image", EXTERNAL_HTTP_TIMEOUT[0])
+        return get_fallback_image(query, image_type)
+
     except Exception as e:
-        print(f"Google Images search error: {e}")
+        logger.warning("Google Images search error: %s", e)
         return get_fallback_image(query, image_type)
 
 
@@ -134,30 +297,12 @@ def is_valid_google_image_url(url: str) -> bool:
     if not url or not isinstance(url, str):
         return False
 
-    url_lower = url.lower()
-
-    # Reject unwanted domains
-    blocked_domains = [
-        'wikimedia.org',
-        'wikipedia.org',
-        'google.com',
-        'googleusercontent.com',
-        'gstatic.com',
-        'encrypted-tbn',  # Google's encrypted thumbnails
-    ]
-
-    if any(domain in url_lower for domain in blocked_domains):
+    # Too long URLs are often problematic
+    if len(url) > MAX_IMAGE_URL_LENGTH:
         return False
 
-    # Must be a direct image URL
-    if not url_lower.endswith(('.jpg', '.jpeg', '.png', '.webp', '.gif')):
-        return False
-
-    # Must be from a reasonable domain
-    if len(url) > 500:  # Too long URLs are often problematic
-        return False
-
-    return True
+    # Must be a direct image URL from a domain that is not blocked
+    return bool(GOOGLE_IMAGE_EXTENSION_RE.search(url)) and not BLOCKED_GOOGLE_IMAGE_DOMAIN_RE.search(url)
 
 
 def get_fallback_image(query: str, image_type: str = "general") -> str:
@@ -167,44 +312,19 @@ def get_fallback_image(query: str, image_type: str = "general") -> str:
     """
     query_lower = query.lower()
 
+    # Keys are checked in order, so the first matching entry wins
     if image_type == "author":
-        # Use actual author photos from reliable sources
-        if "jane austen" in query_lower:
-            return "https://cdn.britannica.com/12/172012-050-DAA7CE2B/Jane-Austen-watercolour-Cassandra-Austen-1810.jpg"
-        elif "shakespeare" in query_lower:
-            return "https://cdn.britannica.com/51/1851-050-7A4E6C35/William-Shakespeare.jpg"
-        elif "stephen king" in query_lower:
-            return "https://cdn.britannica.com/34/206034-050-BBCF8C8A/Stephen-King-2019.jpg"
-        elif "agatha christie" in query_lower:
-            return "https://cdn.britannica.com/30/9230-050-0A4D3C80/Agatha-Christie-1925.jpg"
-        elif "mark twain" in query_lower:
-            return "https://cdn.britannica.com/13/153413-050-2B899E58/Mark-Twain-1907.jpg"
-        else:
-            return "https://placehold.co/400x300/696969/FFFFFF/png?text=Author+Image"
-
+        images, default = AUTHOR_FALLBACK_IMAGES, "https://placehold.co/400x300/696969/FFFFFF/png?text=Author+Image"
     elif image_type == "category":
-        # Use actual category-related images from reliable sources
-        if "entertainment" in query_lower:
-            return "https://cdn.britannica.com/60/182360-050-CD8878D6/scene-Citizen-Kane-Orson-Welles-1941.jpg"
-        elif "technology" in query_lower:
-            return "https://cdn.britannica.com/69/155469-050-3F458ECF/circuit-board-computer.jpg"
-        elif "business" in query_lower:
-            return "https://cdn.britannica.com/77/170477-050-1C747EE3/Nasdaq-MarketSite-Times-Square-New-York-City.jpg"
-        elif "education" in query_lower:
-            return "https://cdn.britannica.com/07/192107-050-7C9F98E8/Harvard-University-Cambridge-Massachusetts.jpg"
-        elif "science" in query_lower:
-            return "https://cdn.britannica.com/86/193986-050-7C6DE899/laboratory-glassware.jpg"
-        elif "health" in query_lower:
-            return "https://cdn.britannica.com/17/196817-050-6A15DAC3/stethoscope.jpg"
-        elif "finance" in query_lower:
-            return "https://cdn.britannica.com/78/170478-050-1C747EE3/New-York-Stock-Exchange-Wall-Street.jpg"
-        elif "sports" in query_lower:
-            return "https://cdn.britannica.com/63/114163-050-7745C043/Soccer-ball-goal.jpg"
-        else:
-            return "https://placehold.co/400x300/708090/FFFFFF/png?text=Category+Image"
+        images, default = CATEGORY_FALLBACK_IMAGES, "https://placehold.co/400x300/708090/FFFFFF/png?text=Category+Image"
+    else:
+        # Default fallback
+        return "https://placehold.co/400x300/A9A9A9/FFFFFF/png?text=Image+Not+Found"
 
-    # Default fallback
-    return "https://placehold.co/400x300/A9A9A9/FFFFFF/png?text=Image+Not+Found"
+    for key, image_url in images.items():
+        if key in query_lower:
+            return image_url
+    return default
 
 
 def search_for_reliable_image(query: str, image_type: str = "general") -> str:
@@ -212,14 +332,18 @@ def search_for_reliable_image(query: str, image_type: str = "general") -> str:
     Main function to search for reliable images.
     First tries Google Images, then falls back to curated images.
     """
-    # Try Google Images first
-    google_result = search_google_images(query, image_type)
+    # The same authors and categories come up across many requests, so reuse earlier lookups
+    cache_key = f"imgsearch:{image_type}:{hashlib.sha1(query.lower().encode()).hexdigest()}"
+    cached = cache.get(cache_key)
+    if cached:
+        return cached
 
-    # If Google search returned a valid result, use it
-    if google_result and not google_result.startswith('https://placehold.co') and not google_result.startswith('https://cdn.britannica.com'):
-        return google_result
+    # Try Google Images first; it returns the curated fallback when the search fails
+    google_result = search_google_images(query, image_type)
 
-    # Otherwise use the fallback (which includes Britannica images)
+    # Only cache real Google hits so a brief outage does not pin the fallback for a day
+    if google_result != get_fallback_image(query, image_type):
+        cache.set(cache_key, google_result, IMAGE_SEARCH_CACHE_TTL)
     return google_result
 
 
@@ -228,7 +352,7 @@ def get_image_url_from_llm(search_term: str, image_type: str = "author") -> str:
     Always return reliable placeholder images instead of querying LLM.
     This ensures we never get broken image URLs.
     """
-    print(f"Getting reliable image for {search_term} ({image_type})")
+    logger.debug("Getting reliable image for %s (%s)", search_term, image_type)
     # Skip LLM entirely and use our reliable fallback
     return search_for_reliable_image(search_term, image_type)
 
@@ -291,7 +415,7 @@ def analyze_book_description(request):
             )
 
         # Initialize LLM service
-        llm_service = LLMService()
+        llm_service = get_llm_service()
 
         # Analyze description and get categories
         analysis_result = llm_service.analyze_description_for_categories(description, language)
@@ -305,10 +429,7 @@ def analyze_book_description(request):
         }, status=status.HTTP_200_OK)
 
     except Exception as e:
-        import traceback
-        error_details = traceback.format_exc()
-        print(f"Description analysis failed with error: {e}")
-        print(f"Full traceback: {error_details}")
+        logger.exception("Description analysis failed with error: %s", e)
 
         return Response(
             {'error': f'Analysis failed: {str(e)}'},
@@ -383,10 +504,10 @@ def ai_book_search_no_db(request):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        start_time = timezone.now()
+        start_time = time.monotonic()
 
         # Step 1: Extract information from query using LLM
-        llm_service = LLMService()
+        llm_service = get_llm_service()
         extracted_info = llm_service.extract_book_info(book_name, language)
 
         # Step 2: Search external APIs
@@ -398,7 +519,7 @@ def ai_book_search_no_db(request):
                 'results': [],
                 'total_found': 0,
                 'extracted_info': extracted_info,
-                'search_time': (timezone.now() - start_time).total_seconds(),
+                'search_time': time.monotonic() - start_time,
                 'language': language,
                 'message': 'No books found matching your search criteria'
             }, status=status.HTTP_200_OK)
@@ -407,30 +528,15 @@ def ai_book_search_no_db(request):
         # PDF URLs will be generated by LLM if needed
 
         # Step 3: Enhance results with LLM-generated content (no database operations)
-        enhanced_results = []
-
-        # Process only the first few results for better performance
-        for result in search_results[:max_results]:
-            try:
-                enhanced_result = enhance_single_result(result, llm_service, language)
-
-                # Step 3.5: Translate main fields to Arabic if needed
-                if language == 'ar':
-                    enhanced_result = translate_result_to_arabic(enhanced_result, llm_service)
-
-                enhanced_results.append(enhanced_result)
+        # The LLM calls are I/O bound, so results are enhanced in parallel; map keeps the original order
+        results_to_enhance = search_results[:max_results]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(results_to_enhance), 8)) as executor:
+            enhanced_results = list(executor.map(
+                lambda result: enhance_and_translate_result(result, llm_service, language),
+                results_to_enhance
+            ))
 
-                # Break early if we have enough results
-                if len(enhanced_results) >= max_results:
-                    break
-
-            except Exception as e:
-                print(f"Error enhancing result: {e}")
-                # Add the original result if enhancement fails
-                enhanced_results.append(result)
-
-        end_time = timezone.now()
-        search_time = (end_time - start_time).total_seconds()
+        search_time = time.monotonic() - start_time
 
         # Return results directly without any database operations
         return Response({
@@ -443,10 +549,7 @@ def ai_book_search_no_db(request):
         }, status=status.HTTP_200_OK)
 
     except Exception as e:
-        import traceback
-        error_details = traceback.format_exc()
-        print(f"Search failed with error: {e}")
-        print(f"Full traceback: {error_details}")
+        logger.exception("Search failed with error: %s", e)
 
         return Response(
             {'error': f'Search failed: {str(e)}'},
@@ -511,7 +614,7 @@ def website_search(request):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        start_time = timezone.now()
+        start_time = time.monotonic()
 
         # Get comprehensive website information using LLM
         try:
@@ -519,7 +622,7 @@ def website_search(request):
             if not website_info or not isinstance(website_info, dict):
                 raise ValueError("Invalid response from LLM")
         except Exception as e:
-            print(f"LLM info failed: {e}")
+            logger.warning("LLM info failed: %s", e)
             website_info = get_fallback_website_info(website_name, language)
 
         # Ensure website_info is a valid dictionary
@@ -530,8 +633,7 @@ def website_search(request):
         if 'website_icon' not in website_info or not website_info['website_icon']:
             website_info['website_icon'] = get_website_icon_url(website_name)
 
-        end_time = timezone.now()
-        search_time = (end_time - start_time).total_seconds()
+        search_time = time.monotonic() - start_time
 
         # Add metadata
         website_info['search_time'] = search_time
@@ -541,10 +643,7 @@ def website_search(request):
         return Response(website_info, status=status.HTTP_200_OK)
 
     except Exception as e:
-        import traceback
-        error_details = traceback.format_exc()
-        print(f"Website search failed with error: {e}")
-        print(f"Full traceback: {error_details}")
+        logger.exception("Website search failed with error: %s", e)
 
         return Response(
             {'error': f'Website search failed: {str(e)}'},
@@ -552,290 +651,6 @@ def website_search(request):
         )
 
 
-
-
-
-def get_author_comprehensive_info(author_name: str, language: str = 'en') -> dict:
-    """
-    Get comprehensive author information using LLM with FIXED image handling.
-    """
-    llm_service = LLMService()
-
-    if language == 'ar':
-        prompt = f"""
-        أنت مساعد بحث متخصص في الأدب والكتاب. ابحث عن معلومات شاملة عن المؤلف: "{author_name}"
-
-        أرجع JSON بهذا التنسيق المحدد (أسماء الحقول بالإنجليزية، القيم بالعربية):
-        {{
-            "name": "{author_name}",
-            "author_image": "LEAVE_EMPTY_FOR_AUTO_SEARCH",
-            "bio": "سيرة ذاتية من 200 كلمة عربية بالضبط تتضمن حياته وأعماله وإنجازاته",
-            "professions": [
-                {{"profession": "كاتب"}},
-                {{"profession": "روائي"}},
-                {{"profession": "شاعر"}}
-            ],
-            "wikilink": "رابط صفحة ويكيبيديا الحقيقية للمؤلف فقط إذا كان متاحاً، إذا لم يوجد اتركه فارغاً.",
-            "youtube_link": "رابط يوتيوب الرسمي إذا متوفر، أو نص فارغ",
-            "birth_year": "سنة الميلاد",
-            "nationality": "الجنسية بالعربية",
-            "notable_works": ["قائمة بأشهر الأعمال بالعربية"]
-        }}
-
-        ملاحظات مهمة:
-        - استخدم معلومات حقيقية ودقيقة عن المؤلف
-        - السيرة الذاتية: 200 كلمة عربية بالضبط
-        - المهن: قائمة كائنات بالعربية
-        - الأعمال المشهورة: بالأسماء العربية إذا ترجمت
-        - اتركه author_image فارغاً دائماً
-        """
-    else:
-        prompt = f"""
-        You are a literature and author research assistant. Find comprehensive information about the author: "{author_name}"
-
-        Return JSON with this exact structure:
-        {{
-            "name": "{author_name}",
-            "author_image": "LEAVE_EMPTY_FOR_AUTO_SEARCH",
-            "bio": "Exactly 200 English words biography including life, works, and achievements",
-            "professions": [
-                {{"profession": "Writer"}},
-                {{"profession": "Novelist"}},
-                {{"profession": "Poet"}}
-            ],
-            "wikilink": "Direct Wikipedia author page link ONLY if available, leave blank if not",
-            "youtube_link": "Official YouTube channel URL if available, empty string if not",
-            "birth_year": "Birth year",
-            "nationality": "Nationality",
-            "notable_works": ["List of most famous works"]
-        }}
-
-        Important notes:
-        - Use real and accurate information about the author
-        - Biography: exactly 200 English words
-        - Professions: list of objects in English
-        - Notable works: use original titles
-        - Always leave author_image empty
-        """
-
-    try:
-        import time
-        time.sleep(0.5)  # Rate limiting
-
-        chat_completion = llm_service.client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a precise literature researcher. Provide accurate, real information about authors and writers. Follow word count requirements exactly."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            model=llm_service.model,
-            response_format={"type": "json_object"},
-            temperature=0.0,
-            max_tokens=1200,
-            timeout=15
-        )
-
-        response = json.loads(chat_completion.choices[0].message.content)
-
-        # Ensure bio word count is correct
-        if 'bio' in response:
-            response['bio'] = ensure_word_count(response['bio'], 200, language)
-
-        # ALWAYS use our reliable image search instead of LLM-provided images
-        response['author_image'] = get_image_url_from_llm(author_name, "author")
-
-        return response
-
-    except Exception as e:
-        print(f"LLM author info error: {e}")
-        return get_fallback_author_info(author_name, language)
-
-
-def get_category_comprehensive_info(category_name: str, language: str = 'en') -> dict:
-    """
-    Get comprehensive category information using LLM with FIXED image handling.
-    """
-    llm_service = LLMService()
-
-    if language == 'ar':
-        prompt = f"""
-        أنت خبير متخصص في بحث الفئات. قدم معلومات مفصلة تحديداً عن فئة "{category_name}".
-
-        أرجع JSON بهذا التنسيق المحدد:
-        {{
-            "name": "اسم الفئة بالعربية",
-            "image_url": "LEAVE_EMPTY_FOR_AUTO_SEARCH",
-            "wikilink": "https://ar.wikipedia.org/wiki/...",
-            "description": "وصف من 150 كلمة عربية بالضبط يشرح ما هي فئة {category_name}، وخصائصها، وميزاتها الرئيسية، وأهميتها."
-        }}
-
-        المتطلبات الأساسية:
-        - الوصف يجب أن يكون بالضبط 150 كلمة عن {category_name} تحديداً
-        - ركز على ما يجعل {category_name} فريدة ومميزة
-        - اترك image_url فارغاً دائماً
-        """
-    else:
-        prompt = f"""
-        You are an expert category researcher. Provide detailed information specifically about the "{category_name}" category.
-
-        Return JSON with this exact structure:
-        {{
-            "name": "{category_name}",
-            "image_url": "LEAVE_EMPTY_FOR_AUTO_SEARCH",
-            "wikilink": "https://en.wikipedia.org/wiki/...",
-            "description": "Exactly 150 English words describing what {category_name} is, its characteristics, key features, and significance."
-        }}
-
-        CRITICAL REQUIREMENTS:
-        - Description must be EXACTLY 150 words about {category_name} specifically
-        - Focus on what makes {category_name} unique and distinct
-        - Always leave image_url empty
-        """
-
-    try:
-        import time
-        time.sleep(0.5)  # Rate limiting
-
-        chat_completion = llm_service.client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a precise industry researcher. Provide accurate, real information about categories and industries. Follow word count requirements exactly."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            model=llm_service.model,
-            response_format={"type": "json_object"},
-            temperature=0.0,
-            max_tokens=1000,
-            timeout=15
-        )
-
-        response = json.loads(chat_completion.choices[0].message.content)
-
-        # Ensure description word count is correct
-        if 'description' in response:
-            response['description'] = ensure_word_count(response['description'], 150, language)
-
-        # ALWAYS use our reliable image search instead of LLM-provided images
-        response['image_url'] = get_image_url_from_llm(category_name, "category")
-
-        return response
-
-    except Exception as e:
-        print(f"LLM category info error: {e}")
-        return get_fallback_category_info(category_name, language)
-
-
-def get_fallback_author_info(author_name: str, language: str) -> dict:
-    """
-    Fallback author information when LLM fails.
-    """
-    if language == 'ar':
-        return {
-            "name": author_name,
-            "author_image": get_image_url_from_llm(author_name, "author"),
-            "bio": ensure_word_count(f"{author_name} هو مؤلف معروف له إسهامات مهمة في الأدب", 200, 'ar'),
-            "professions": [{"profession": "كاتب"}],
-            "wikilink": f"https://ar.wikipedia.org/wiki/{author_name.replace(' ', '_')}",
-            "youtube_link": "",
-            "birth_year": "غير محدد",
-            "nationality": "غير محدد",
-            "notable_works": ["أعمال متنوعة"]
-        }
-    else:
-        return {
-            "name": author_name,
-            "author_image": get_image_url_from_llm(author_name, "author"),
-            "bio": ensure_word_count(f"{author_name} is a notable author with significant contributions to literature", 200, 'en'),
-            "professions": [{"profession": "Writer"}],
-            "wikilink": f"https://en.wikipedia.org/wiki/{author_name.replace(' ', '_')}",
-            "youtube_link": "",
-            "birth_year": "Unknown",
-            "nationality": "Unknown",
-            "notable_works": ["Various works"]
-        }
-
-
-def get_fallback_category_info(category_name: str, language: str) -> dict:
-    """
-    Fallback category information when LLM fails.
-    """
-    if language == 'ar':
-        return {
-            "name": category_name,
-            "image_url": get_image_url_from_llm(category_name, "category"),
-            "wikilink": f"https://ar.wikipedia.org/wiki/{category_name}",
-            "description": ensure_word_count(f"فئة {category_name} تشمل مجموعة واسعة من الأنشطة والخدمات المهمة", 150, 'ar')
-        }
-    else:
-        return {
-            "name": category_name,
-            "image_url": get_image_url_from_llm(category_name, "category"),
-            "wikilink": f"https://en.wikipedia.org/wiki/{category_name}",
-            "description": ensure_word_count(f"The {category_name} category encompasses a wide range of important activities and services", 150, 'en')
-        }
-
-
-def ensure_word_count(text: str, target_words: int, language: str = 'en') -> str:
-    """
-    Ensure text meets the target word count.
-    """
-    if not text:
-        if language == 'ar':
-            base_text = "هذا وصف أساسي للموضوع المطلوب"
-        else:
-            base_text = "This is a basic description of the requested topic"
-        text = base_text
-
-    words = text.split()
-    current_count = len(words)
-
-    if current_count == target_words:
-        return text
-    elif current_count > target_words:
-        return ' '.join(words[:target_words])
-    else:
-        words_needed = target_words - current_count
-        if language == 'ar':
-            if words_needed <= 5:
-                extension = "وغيرها من الخدمات المميزة."
-            elif words_needed <= 10:
-                extension = "وغيرها من الخدمات المميزة التي تلبي احتياجات المستخدمين."
-            else:
-                extension = "وغيرها من الخدمات المميزة التي تلبي احتياجات المستخدمين في مختلف أنحاء العالم، مما يجعلها خياراً مفضلاً للكثيرين."
-        else:
-            if words_needed <= 5:
-                extension = "and other similar services."
-            elif words_needed <= 10:
-                extension = "and other similar services that meet user needs and expectations."
-            else:
-                extension = "and other similar services that meet user needs and expectations in various markets worldwide, making it a preferred choice for many users globally."
-
-        extension_words = extension.split()
-        words.extend(extension_words[:min(words_needed, len(extension_words))])
-
-        if len(words) < target_words:
-            remaining_words = target_words - len(words)
-            if language == 'ar':
-                conclusion = "هذه المنصة تستمر في التطور والنمو لتقديم أفضل تجربة ممكنة للمستخدمين في جميع أنحاء العالم."
-            else:
-                conclusion = "This platform continues to evolve and grow to provide the best possible experience for users around the world."
-
-            conclusion_words = conclusion.split()
-            words.extend(conclusion_words[:min(remaining_words, len(conclusion_words))])
-
-        return ' '.join(words[:target_words])
-
-
 @api_view(['POST'])
 def author_search(request):
     """
@@ -857,31 +672,28 @@ def author_search(request):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        start_time = timezone.now()
+        start_time = time.monotonic()
 
         # Get author info with FIXED image handling
         try:
             author_info = get_author_comprehensive_info(author_name, language)
         except Exception as e:
-            print(f"LLM author info failed: {e}")
+            logger.warning("LLM author info failed: %s", e)
             author_info = get_fallback_author_info(author_name, language)
 
         # ALWAYS ensure we have a valid image URL
         if not is_valid_image_url(author_info.get("author_image", "")):
-            print(f"Author image invalid, getting reliable fallback for {author_name}")
+            logger.debug("Author image invalid, getting reliable fallback for %s", author_name)
             author_info["author_image"] = get_image_url_from_llm(author_name, "author")
 
-        end_time = timezone.now()
-        author_info['search_time'] = (end_time - start_time).total_seconds()
+        author_info['search_time'] = time.monotonic() - start_time
         author_info['language'] = language
         author_info['note'] = 'Author information with FIXED image handling'
 
         return Response(author_info, status=status.HTTP_200_OK)
 
     except Exception as e:
-        import traceback
-        print(f"Author search failed with error: {e}")
-        print(traceback.format_exc())
+        logger.exception("Author search failed with error: %s", e)
 
         return Response(
             {'error': f'Author search failed: {str(e)}'},
@@ -904,31 +716,28 @@ def category_search(request):
         if language not in ["en", "ar"]:
             return Response({"error": "language must be 'en' or 'ar'"}, status=status.HTTP_400_BAD_REQUEST)
 
-        start_time = timezone.now()
+        start_time = time.monotonic()
 
         # Get category info with FIXED image handling
         try:
             category_info = get_category_comprehensive_info(category_name, language)
         except Exception as e:
-            print(f"LLM category info failed: {e}")
+            logger.warning("LLM category info failed: %s", e)
             category_info = get_fallback_category_info(category_name, language)
 
         # ALWAYS ensure we have a valid image URL
         if not is_valid_image_url(category_info.get("image_url", "")):
-            print(f"Category image invalid, getting reliable fallback for {category_name}")
+            logger.debug("Category image invalid, getting reliable fallback for %s", category_name)
             category_info["image_url"] = get_image_url_from_llm(category_name, "category")
 
-        end_time = timezone.now()
-        category_info["search_time"] = (end_time - start_time).total_seconds()
+        category_info["search_time"] = time.monotonic() - start_time
         category_info["language"] = language
         category_info["note"] = "Category information with FIXED image handling"
 
         return Response(category_info, status=status.HTTP_200_OK)
 
     except Exception as e:
-        import traceback
-        print("Category search failed:", e)
-        print(traceback.format_exc())
+        logger.exception("Category search failed: %s", e)
         return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
@@ -1008,7 +817,7 @@ def company_search(request):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        start_time = timezone.now()
+        start_time = time.monotonic()
 
         # Get comprehensive company information using LLM
         try:
@@ -1023,54 +832,28 @@ def company_search(request):
                 # Verify accuracy of company information
                 company_info = verify_company_accuracy(company_info, company_name)
         except Exception as e:
-            print(f"LLM company info failed: {e}")
+            logger.warning("LLM company info failed: %s", e)
             company_info = get_fallback_company_info(company_name, language)
 
-        # Try to get accurate stock data from Yahoo Finance API
+        # The stock quote and the description LLM call don't depend on each other, so run them side by side
         stock_code = company_info.get('code', '').upper()
-        if stock_code:
-            try:
-                print(f"Attempting to fetch stock data for {stock_code}")
-                stock_data = get_real_stock_data(stock_code)
-                if stock_data:
-                    # Update company info with accurate stock data
-                    company_info.update(stock_data)
-                    print(f"✅ Successfully fetched real stock data for {stock_code}")
-                    print(f"Market cap: {stock_data.get('market_cap', 'N/A')}")
-                    print(f"Stock price: ${stock_data.get('yesterday_close', 'N/A')}")
-                else:
-                    print(f"❌ No stock data available for {stock_code}")
-            except Exception as e:
-                print(f"❌ Real stock data fetch failed for {stock_code}: {e}")
-        else:
-            print(f"ℹ️  No stock code found for {company_name} - treating as private company")
-
-        # Add company logo if not provided or invalid
-        if 'logo' not in company_info or not is_valid_image_url(company_info['logo']):
-            company_info['logo'] = get_company_logo_url(company_info.get('web_url', company_name))
-
-        # Add description field
-        if 'description' not in company_info or not company_info['description']:
-            llm_service = LLMService()
-            description_prompt = f"Provide a detailed description of {company_name} in {language} (200-300 words)."
-            try:
-                description_response = llm_service.client.chat.completions.create(
-                    messages=[
-                        {"role": "system", "content": "You are a helpful assistant that provides detailed company descriptions."},
-                        {"role": "user", "content": description_prompt,}
-                    ],
-                    model=llm_service.model,
-                    temperature=0.0,
-                    max_tokens=400,
-                    timeout=15
-                )
-                company_info['description'] = ensure_word_count(description_response.choices[0].message.content.strip(), 250, language) # Aim for 250 words
-            except Exception as e:
-                print(f"Error generating company description: {e}")
-                company_info['description'] = ensure_word_count(f"Description for {company_name}", 250, language)
-
-        end_time = timezone.now()
-        search_time = (end_time - start_time).total_seconds()
+        needs_description = 'description' not in company_info or not company_info['description']
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            stock_future = executor.submit(fetch_company_stock_data, stock_code, company_name)
+            description_future = executor.submit(generate_company_description, company_name, language) if needs_description else None
+
+            # Update company info with accurate stock data
+            company_info.update(stock_future.result())
+
+            # Add company logo if not provided or invalid
+            if 'logo' not in company_info or not is_valid_image_url(company_info['logo']):
+                company_info['logo'] = get_company_logo_url(company_info.get('web_url', company_name))
+
+            # Add description field
+            if description_future:
+                company_info['description'] = description_future.result()
+
+        search_time = time.monotonic() - start_time
 
         # Add metadata
         company_info['search_time'] = search_time
@@ -1079,16 +862,60 @@ def company_search(request):
 
         return Response(company_info, status=status.HTTP_200_OK)
 
-    except Exception as e:
-        import traceback
-        error_details = traceback.format_exc()
-        print(f"Company search failed with error: {e}")
-        print(f"Full traceback: {error_details}")
+    except Exception as e:
+        logger.exception("Company search failed with error: %s", e)
+
+        return Response(
+            {'error': f'Company search failed: {str(e)}'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+def fetch_company_stock_data(stock_code: str, company_name: str) -> dict:
+    """
+    Try to get accurate stock data from Yahoo Finance API.
+    Returns an empty dict for private companies or when the lookup fails.
+    """
+    if not stock_code:
+        logger.debug("No stock code found for %s - treating as private company", company_name)
+        return {}
+
+    try:
+        logger.debug("Attempting to fetch stock data for %s", stock_code)
+        stock_data = get_real_stock_data(stock_code)
+        if stock_data:
+            logger.debug(
+                "Fetched stock data for %s (market cap: %s, close: $%s)",
+                stock_code, stock_data.get('market_cap', 'N/A'), stock_data.get('yesterday_close', 'N/A')
+            )
+        else:
+            logger.debug("No stock data available for %s", stock_code)
+        return stock_data
+    except Exception as e:
+        logger.warning("Stock data fetch failed for %s: %s", stock_code, e)
+        return {}
+
 
-        return Response(
-            {'error': f'Company search failed: {str(e)}'},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+def generate_company_description(company_name: str, language: str) -> str:
+    """
+    Generate a ~250 word company description with the LLM, or a padded placeholder if it fails.
+    """
+    llm_service = get_llm_service()
+    description_prompt = f"Provide a detailed description of {company_name} in {language} (200-300 words)."
+    try:
+        description_response = llm_service._call_groq(
+            messages=[
+                {"role": "system", "content": "You are a helpful assistant that provides detailed company descriptions."},
+                {"role": "user", "content": description_prompt,}
+            ],
+            temperature=0.0,
+            max_tokens=400,
+            timeout=15
         )
+        return ensure_word_count(description_response.choices[0].message.content.strip(), 250, language) # Aim for 250 words
+    except Exception as e:
+        logger.warning("Error generating company description: %s", e)
+        return ensure_word_count(f"Description for {company_name}", 250, language)
 
 
 def get_company_comprehensive_info(company_name: str, language: str = 'en') -> dict:
@@ -1102,7 +929,7 @@ def get_company_comprehensive_info(company_name: str, language: str = 'en') -> d
     Returns:
         Dict with comprehensive company information
     """
-    llm_service = LLMService()
+    llm_service = get_llm_service()
 
     if language == 'ar':
         prompt = f"""
@@ -1187,29 +1014,16 @@ def get_company_comprehensive_info(company_name: str, language: str = 'en') -> d
         """
 
     try:
-        import time
-        time.sleep(0.5)  # Rate limiting
-
-        chat_completion = llm_service.client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a precise company and financial researcher. Provide accurate, real information about companies and their stock information. Follow word count requirements exactly."
-                },
-                {
-                    "role": "user",
-                    "content": prompt,
-                }
-            ],
-            model=llm_service.model,
-            response_format={"type": "json_object"},
-            temperature=0.0,  # Zero temperature for most consistent results
+        # Stock figures are fetched separately, so the LLM's profile can be reused for a day
+        response = llm_service._call_json(
+            prompt,
+            temperature=0.0,
+            system_prompt="You are a precise company and financial researcher. Provide accurate, real information about companies and their stock information. Follow word count requirements exactly.",
+            cache_ttl=LLM_LOOKUP_CACHE_TTL,
             max_tokens=1200,
             timeout=15
         )
 
-        response = json.loads(chat_completion.choices[0].message.content)
-
         # Ensure category description word count is correct
         if 'category' in response and 'description' in response['category']:
             response['category']['description'] = ensure_word_count(
@@ -1219,11 +1033,74 @@ def get_company_comprehensive_info(company_name: str, language: str = 'en') -> d
         return response
 
     except Exception as e:
-        print(f"LLM company info error: {e}")
+        logger.warning("LLM company info error: %s", e)
         # Fallback response
         return get_fallback_company_info(company_name, language)
 
 
+# English -> Arabic lookups used by translate_company_info_to_arabic
+# Country translations
+COUNTRY_TRANSLATIONS_AR = {
+    'United States': 'الولايات المتحدة الأمريكية',
+    'India': 'الهند',
+    'United Kingdom': 'المملكة المتحدة',
+    'China': 'الصين',
+    'Japan': 'اليابان',
+    'Germany': 'ألمانيا',
+    'France': 'فرنسا',
+    'Canada': 'كندا',
+    'Australia': 'أستراليا',
+    'South Korea': 'كوريا الجنوبية',
+    'Netherlands': 'هولندا',
+    'Switzerland': 'سويسرا',
+    'Unknown': 'غير محدد'
+}
+
+# Industry category translations
+INDUSTRY_TRANSLATIONS_AR = {
+    'Technology': 'التكنولوجيا',
+    'Information Technology': 'تكنولوجيا المعلومات',
+    'Finance': 'الخدمات المالية',
+    'Healthcare': 'الرعاية الصحية',
+    'Entertainment': 'الترفيه',
+    'Retail': 'التجارة',
+    'Energy': 'الطاقة',
+    'Automotive': 'السيارات',
+    'Telecommunications': 'الاتصالات',
+    'Business': 'الأعمال',
+    'Software': 'البرمجيات',
+    'Consulting': 'الاستشارات',
+    'Services': 'الخدمات'
+}
+
+# City/Location translations
+LOCATION_TRANSLATIONS_AR = {
+    'Mumbai, India': 'مومباي، الهند',
+    'New York, USA': 'نيويورك، الولايات المتحدة',
+    'London, UK': 'لندن، المملكة المتحدة',
+    'Tokyo, Japan': 'طوكيو، اليابان',
+    'Beijing, China': 'بكين، الصين',
+    'Mumbai': 'مومباي',
+    'New York': 'نيويورك',
+    'London': 'لندن',
+    'Tokyo': 'طوكيو',
+    'Beijing': 'بكين',
+    'Unknown': 'غير محدد'
+}
+
+# Company name translations
+COMPANY_NAME_TRANSLATIONS_AR = {
+    'Tata Consultancy Services Limited': 'شركة تاتا للخدمات الاستشارية المحدودة',
+    'Tata Consultancy Services': 'شركة تاتا للخدمات الاستشارية',
+    'Apple Inc.': 'شركة آبل المحدودة',
+    'Microsoft Corporation': 'شركة مايكروسوفت',
+    'Google LLC': 'شركة جوجل',
+    'Amazon.com Inc.': 'شركة أمازون',
+    'Meta Platforms Inc.': 'شركة ميتا',
+    'Tesla Inc.': 'شركة تيسلا'
+}
+
+
 def translate_company_info_to_arabic(company_info_en: dict, company_name: str) -> dict:
     """
     Translate company information from English to Arabic.
@@ -1238,89 +1115,24 @@ def translate_company_info_to_arabic(company_info_en: dict, company_name: str) -
     if not company_info_en:
         return get_fallback_company_info(company_name, 'ar')
 
-    # Country translations
-    country_translations = {
-        'United States': 'الولايات المتحدة الأمريكية',
-        'India': 'الهند',
-        'United Kingdom': 'المملكة المتحدة',
-        'China': 'الصين',
-        'Japan': 'اليابان',
-        'Germany': 'ألمانيا',
-        'France': 'فرنسا',
-        'Canada': 'كندا',
-        'Australia': 'أستراليا',
-        'South Korea': 'كوريا الجنوبية',
-        'Netherlands': 'هولندا',
-        'Switzerland': 'سويسرا',
-        'Unknown': 'غير محدد'
-    }
-
-    # Industry category translations
-    category_translations = {
-        'Technology': 'التكنولوجيا',
-        'Information Technology': 'تكنولوجيا المعلومات',
-        'Finance': 'الخدمات المالية',
-        'Healthcare': 'الرعاية الصحية',
-        'Entertainment': 'الترفيه',
-        'Retail': 'التجارة',
-        'Energy': 'الطاقة',
-        'Automotive': 'السيارات',
-        'Telecommunications': 'الاتصالات',
-        'Business': 'الأعمال',
-        'Software': 'البرمجيات',
-        'Consulting': 'الاستشارات',
-        'Services': 'الخدمات'
-    }
-
-    # City/Location translations
-    location_translations = {
-        'Mumbai, India': 'مومباي، الهند',
-        'New York, USA': 'نيويورك، الولايات المتحدة',
-        'London, UK': 'لندن، المملكة المتحدة',
-        'Tokyo, Japan': 'طوكيو، اليابان',
-        'Beijing, China': 'بكين، الصين',
-        'Mumbai': 'مومباي',
-        'New York': 'نيويورك',
-        'London': 'لندن',
-        'Tokyo': 'طوكيو',
-        'Beijing': 'بكين',
-        'Unknown': 'غير محدد'
-    }
-
     # Get original values
     original_category_name = company_info_en.get('category', {}).get('name', 'Business')
     original_headquarters = company_info_en.get('headquarters', 'Unknown')
     original_country = company_info_en.get('country_origin', 'Unknown')
+    translated_category_name = INDUSTRY_TRANSLATIONS_AR.get(original_category_name, original_category_name)
 
     # Translate headquarters
-    translated_headquarters = location_translations.get(original_headquarters, original_headquarters)
+    translated_headquarters = LOCATION_TRANSLATIONS_AR.get(original_headquarters, original_headquarters)
     # If not found in direct mapping, try to translate parts
     if translated_headquarters == original_headquarters and ',' in original_headquarters:
         parts = [part.strip() for part in original_headquarters.split(',')]
         translated_parts = []
         for part in parts:
-            if part in location_translations:
-                translated_parts.append(location_translations[part])
-            elif part in country_translations:
-                translated_parts.append(country_translations[part])
-            else:
-                translated_parts.append(part)
+            translated_parts.append(LOCATION_TRANSLATIONS_AR.get(part) or COUNTRY_TRANSLATIONS_AR.get(part, part))
         translated_headquarters = '، '.join(translated_parts)
 
-    # Company name translations
-    company_name_translations = {
-        'Tata Consultancy Services Limited': 'شركة تاتا للخدمات الاستشارية المحدودة',
-        'Tata Consultancy Services': 'شركة تاتا للخدمات الاستشارية',
-        'Apple Inc.': 'شركة آبل المحدودة',
-        'Microsoft Corporation': 'شركة مايكروسوفت',
-        'Google LLC': 'شركة جوجل',
-        'Amazon.com Inc.': 'شركة أمازون',
-        'Meta Platforms Inc.': 'شركة ميتا',
-        'Tesla Inc.': 'شركة تيسلا'
-    }
-
     original_name = company_info_en.get('name', company_name)
-    translated_name = company_name_translations.get(original_name, original_name)
+    translated_name = COMPANY_NAME_TRANSLATIONS_AR.get(original_name, original_name)
 
     # Translate the company info
     translated_info = {
@@ -1329,13 +1141,13 @@ def translate_company_info_to_arabic(company_info_en: dict, company_name: str) -
         "company_email": company_info_en.get('company_email', ''),
         "web_url": company_info_en.get('web_url', ''),
         "logo": company_info_en.get('logo', ''),
-        "country_origin": country_translations.get(original_country, original_country),
+        "country_origin": COUNTRY_TRANSLATIONS_AR.get(original_country, original_country),
         "category": {
-            "name": category_translations.get(original_category_name, original_category_name),
+            "name": translated_category_name,
             "icon": company_info_en.get('category', {}).get('icon', '🏢'),
             "wikilink": company_info_en.get('category', {}).get('wikilink', '').replace('en.wikipedia.org', 'ar.wikipedia.org'),
             "description": ensure_word_count(
-                f"فئة {category_translations.get(original_category_name, original_category_name)} تشمل الشركات والمؤسسات التي تعمل في هذا المجال",
+                f"فئة {translated_category_name} تشمل الشركات والمؤسسات التي تعمل في هذا المجال",
                 100, 'ar'
             )
         },
@@ -1354,9 +1166,6 @@ def get_real_stock_data(stock_code: str) -> dict:
     Get real, accurate stock data from Yahoo Finance API (free).
     """
     try:
-        import requests
-        from datetime import datetime
-
         # Use Yahoo Finance API (free and reliable)
         base_url = "https://query1.finance.yahoo.com/v8/finance/chart"
         quote_url = f"{base_url}/{stock_code}?interval=1d&range=1y"
@@ -1365,7 +1174,7 @@ def get_real_stock_data(stock_code: str) -> dict:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
 
-        response = requests.get(quote_url, headers=headers, timeout=10)
+        response = requests.get(quote_url, headers=headers, timeout=EXTERNAL_HTTP_TIMEOUT)
 
         if response.status_code == 200:
             data = response.json()
@@ -1449,7 +1258,7 @@ def get_real_stock_data(stock_code: str) -> dict:
         return {}
 
     except Exception as e:
-        print(f"Error fetching real stock data for {stock_code}: {e}")
+        logger.warning("Error fetching stock data for %s: %s", stock_code, e)
         return {}
 
 
@@ -1465,23 +1274,24 @@ def format_market_cap(market_cap: int) -> str:
         return str(market_cap)
 
 
+# Known approximate shares outstanding for major companies (in billions)
+KNOWN_SHARES_OUTSTANDING = {
+    'MSFT': 7.4,  # Microsoft ~7.4B shares
+    'AAPL': 15.3, # Apple ~15.3B shares
+    'GOOGL': 12.3, # Google ~12.3B shares
+    'TSLA': 3.2,  # Tesla ~3.2B shares
+    'AMZN': 10.5, # Amazon ~10.5B shares
+}
+
+
 def get_fallback_market_cap(stock_code: str, current_price: float) -> int:
     """
     Get fallback market cap for major companies when API doesn't provide it.
     """
-    # Known approximate shares outstanding for major companies (in billions)
-    known_shares = {
-        'MSFT': 7.4,  # Microsoft ~7.4B shares
-        'AAPL': 15.3, # Apple ~15.3B shares
-        'GOOGL': 12.3, # Google ~12.3B shares
-        'TSLA': 3.2,  # Tesla ~3.2B shares
-        'AMZN': 10.5, # Amazon ~10.5B shares
-    }
-
-    if stock_code in known_shares and current_price > 0:
-        shares_billion = known_shares[stock_code]
+    if stock_code in KNOWN_SHARES_OUTSTANDING and current_price > 0:
+        shares_billion = KNOWN_SHARES_OUTSTANDING[stock_code]
         market_cap = int(shares_billion * 1_000_000_000 * current_price)
-        print(f"Calculated market cap for {stock_code}: {format_market_cap(market_cap)}")
+        logger.debug("Calculated market cap for %s: %s", stock_code, market_cap)
         return market_cap
 
     return 0
@@ -1499,53 +1309,55 @@ def is_publicly_traded_company(company_name: str, stock_code: str) -> bool:
         return False
 
 
+# Known corrections for common companies (read-only, values are copied into the result)
+COMPANY_CORRECTIONS = {
+    'msaari': {
+        'country_origin': 'United Arab Emirates',
+        'headquarters': 'Dubai, United Arab Emirates',
+        'code': '',  # Not publicly traded
+    },
+    'microsoft': {
+        'country_origin': 'United States',
+        'headquarters': 'Redmond, Washington, United States',
+        'code': 'MSFT',
+    },
+    'apple': {
+        'country_origin': 'United States',
+        'headquarters': 'Cupertino, California, United States',
+        'code': 'AAPL',
+    },
+    'tesla': {
+        'country_origin': 'United States',
+        'headquarters': 'Austin, Texas, United States',
+        'code': 'TSLA',
+    }
+}
+KNOWN_US_COMPANIES = frozenset({'microsoft', 'apple', 'tesla', 'google', 'amazon', 'facebook', 'netflix'})
+
+
 def verify_company_accuracy(company_info: dict, company_name: str) -> dict:
     """
     Verify and correct company information for accuracy.
     """
     try:
-        # Known corrections for common companies
-        corrections = {
-            'msaari': {
-                'country_origin': 'United Arab Emirates',
-                'headquarters': 'Dubai, United Arab Emirates',
-                'code': '',  # Not publicly traded
-            },
-            'microsoft': {
-                'country_origin': 'United States',
-                'headquarters': 'Redmond, Washington, United States',
-                'code': 'MSFT',
-            },
-            'apple': {
-                'country_origin': 'United States',
-                'headquarters': 'Cupertino, California, United States',
-                'code': 'AAPL',
-            },
-            'tesla': {
-                'country_origin': 'United States',
-                'headquarters': 'Austin, Texas, United States',
-                'code': 'TSLA',
-            }
-        }
-
         company_key = company_name.lower().strip()
 
-        if company_key in corrections:
-            correction = corrections[company_key]
+        if company_key in COMPANY_CORRECTIONS:
+            correction = COMPANY_CORRECTIONS[company_key]
             for key, value in correction.items():
                 if key in company_info:
                     company_info[key] = value
-                    print(f"Corrected {key} for {company_name}: {value}")
+                    logger.debug("Corrected %s for %s: %s", key, company_name, value)
 
         # Additional validation
-        if company_info.get('country_origin') == 'United States' and company_key not in ['microsoft', 'apple', 'tesla', 'google', 'amazon', 'facebook', 'netflix']:
+        if company_info.get('country_origin') == 'United States' and company_key not in KNOWN_US_COMPANIES:
             # Double-check if this is really a US company
-            print(f"WARNING: Verify if {company_name} is actually from United States")
+            logger.info("Verify if %s is actually from United States", company_name)
 
         return company_info
 
     except Exception as e:
-        print(f"Error in company verification: {e}")
+        logger.warning("Error in company verification: %s", e)
         return company_info
 
 
@@ -1556,6 +1368,25 @@ def get_company_stock_data(stock_code: str) -> dict:
     return get_real_stock_data(stock_code)
 
 
+# Host part of a website URL, without scheme or leading "www."
+URL_DOMAIN_RE = re.compile(r'^(?:https?://)?(?:www\.)?([^/]+)', re.IGNORECASE)
+# Noise removed from a lowercased company name to guess its ".com" domain
+COMPANY_DOMAIN_NOISE_RE = re.compile(r'[ .]|inc|corp')
+# Logo domains for frequently searched tickers, whose symbols don't match their domains
+KNOWN_LOGO_DOMAINS = {
+    'AAPL': 'apple.com',
+    'MSFT': 'microsoft.com',
+    'GOOGL': 'google.com',
+    'GOOG': 'google.com',
+    'AMZN': 'amazon.com',
+    'META': 'meta.com',
+    'TSLA': 'tesla.com',
+    'NVDA': 'nvidia.com',
+    'NFLX': 'netflix.com',
+    '2222.SR': 'aramco.com',
+}
+
+
 def get_company_logo_url(web_url_or_name: str) -> str:
     """
     Get company logo URL using common patterns and reliable sources.
@@ -1571,18 +1402,21 @@ def get_company_logo_url(web_url_or_name: str) -> str:
             return "https://via.placeholder.com/200x200/cccccc/666666?text=Company+Logo"
 
         # Extract domain from URL or use name
-        if web_url_or_name.startswith('http'):
-            domain = web_url_or_name.replace('https://', '').replace('http://', '').replace('www.', '').split('/')[0]
+        known_domain = KNOWN_LOGO_DOMAINS.get(web_url_or_name.upper())
+        if known_domain:
+            domain = known_domain
+        elif web_url_or_name.startswith('http'):
+            domain = URL_DOMAIN_RE.match(web_url_or_name).group(1)
         else:
             # Convert company name to likely domain
-            domain = web_url_or_name.lower().replace(' ', '').replace('inc', '').replace('corp', '').replace('.', '') + '.com'
+            domain = COMPANY_DOMAIN_NOISE_RE.sub('', web_url_or_name.lower()) + '.com'
 
         # Try Clearbit logo API (free tier available)
         clearbit_url = f"https://logo.clearbit.com/{domain}"
         return clearbit_url
 
     except Exception as e:
-        print(f"Logo URL generation error: {e}")
+        logger.warning("Logo URL generation error: %s", e)
         return "https://via.placeholder.com/200x200/cccccc/666666?text=Company+Logo"
 
 
@@ -1672,21 +1506,9 @@ def get_fallback_company_info(company_name: str, language: str) -> dict:
         }
 
 
-def get_category_comprehensive_info(category_name: str, language: str = 'en') -> dict:
-    """
-    Get comprehensive category information using LLM.
-
-    Args:
-        category_name: Name of the category
-        language: Language preference
-
-    Returns:
-        Dict with comprehensive category information
-    """
-    llm_service = LLMService()
-
-    if language == 'ar':
-        prompt = f"""
+# Prompt templates for category lookups, formatted with the category name
+CATEGORY_INFO_PROMPTS = {
+    'ar': """
         أنت خبير متخصص في بحث الفئات. قدم معلومات مفصلة تحديداً عن فئة "{category_name}".
 
         أرجع JSON بهذا التنسيق المحدد:
@@ -1707,9 +1529,8 @@ def get_category_comprehensive_info(category_name: str, language: str = 'en') ->
 
         مثال للترفيه: اوصف الأفلام، التلفزيون، الموسيقى، الألعاب، المسرح - وليس مفاهيم الأعمال العامة.
         مثال للتكنولوجيا: اوصف البرمجيات، الأجهزة، الابتكار، الحلول الرقمية - وليس معلومات الشركات العامة.
-        """
-    else:
-        prompt = f"""
+        """,
+    'en': """
         You are an expert category researcher. Provide detailed information specifically about the "{category_name}" category.
 
         Return JSON with this exact structure:
@@ -1729,46 +1550,51 @@ def get_category_comprehensive_info(category_name: str, language: str = 'en') ->
 
         Example for "Entertainment": Describe movies, TV, music, gaming, theater - not general business concepts.
         Example for "Technology": Describe software, hardware, innovation, digital solutions - not general company info.
-        """
+        """,
+}
 
-    try:
-        import time
-        time.sleep(0.5)  # Rate limiting
 
-        chat_completion = llm_service.client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a precise industry researcher. Provide accurate, real information about categories and industries. Follow word count requirements exactly."
-                },
-                {
-                    "role": "user",
-                    "content": prompt,
-                }
-            ],
-            model=llm_service.model,
-            response_format={"type": "json_object"},
-            temperature=0.0,  # Zero temperature for most consistent results
+@cache_entity_lookups
+@coalesce_inflight_lookups
+def get_category_comprehensive_info(category_name: str, language: str = 'en') -> dict:
+    """
+    Get comprehensive category information using LLM.
+
+    Args:
+        category_name: Name of the category
+        language: Language preference
+
+    Returns:
+        Dict with comprehensive category information
+    """
+    llm_service = get_llm_service()
+
+    prompt = CATEGORY_INFO_PROMPTS['ar' if language == 'ar' else 'en'].format(category_name=category_name)
+
+    try:
+        # Paced by the shared Groq token bucket instead of a fixed sleep
+        response = llm_service._call_json(
+            prompt,
+            temperature=0.0,
+            system_prompt="You are a precise industry researcher. Provide accurate, real information about categories and industries. Follow word count requirements exactly.",
             max_tokens=1000,
             timeout=15
         )
 
-        response = json.loads(chat_completion.choices[0].message.content)
-
         # Ensure description word count is correct
         if 'description' in response:
             response['description'] = ensure_word_count(response['description'], 150, language)
 
-        # Auto-search for category image with validation
-        if 'image_url' in response and (not response['image_url'] or response['image_url'] == "LEAVE_EMPTY_FOR_AUTO_SEARCH"):
+        # Only search for a category image when the LLM did not return a usable one
+        if not is_valid_image_url(response.get('image_url', '')):
             response['image_url'] = get_image_url_from_llm(category_name, "category")
 
         return response
 
     except Exception as e:
-        print(f"LLM category info error: {e}")
+        logger.warning("LLM category info error: %s", e)
         # Fallback response
-        return get_fallback_category_info(category_name, language)
+        return {**get_fallback_category_info(category_name, language), '_fallback': True}
 
 
 def get_fallback_category_info(category_name: str, language: str) -> dict:
@@ -1785,50 +1611,6 @@ def get_fallback_category_info(category_name: str, language: str) -> dict:
     if not category_name:
         category_name = "General"
 
-    # Map common categories to icons and basic info
-    category_lower = category_name.lower()
-
-    category_mappings = {
-        'entertainment': {
-            'icon': '🎬',
-            'subcategories_en': ['Movies', 'Music', 'Television', 'Gaming', 'Theater'],
-            'subcategories_ar': ['أفلام', 'موسيقى', 'تلفزيون', 'ألعاب', 'مسرح'],
-            'companies': ['Disney', 'Netflix', 'Warner Bros', 'Sony Entertainment']
-        },
-        'technology': {
-            'icon': '💻',
-            'subcategories_en': ['Software', 'Hardware', 'AI', 'Cloud Computing', 'Mobile'],
-            'subcategories_ar': ['برمجيات', 'أجهزة', 'ذكاء اصطناعي', 'حوسبة سحابية', 'هواتف'],
-            'companies': ['Apple', 'Google', 'Microsoft', 'Amazon']
-        },
-        'education': {
-            'icon': '📚',
-            'subcategories_en': ['K-12 Education', 'Higher Education', 'Online Learning', 'Vocational Training'],
-            'subcategories_ar': ['التعليم الأساسي', 'التعليم العالي', 'التعلم الإلكتروني', 'التدريب المهني'],
-            'companies': ['Pearson', 'McGraw-Hill', 'Coursera', 'Khan Academy']
-        },
-        'healthcare': {
-            'icon': '🏥',
-            'subcategories_en': ['Hospitals', 'Pharmaceuticals', 'Medical Devices', 'Telemedicine'],
-            'subcategories_ar': ['مستشفيات', 'أدوية', 'أجهزة طبية', 'طب عن بعد'],
-            'companies': ['Johnson & Johnson', 'Pfizer', 'UnitedHealth', 'Roche']
-        },
-        'finance': {
-            'icon': '💰',
-            'subcategories_en': ['Banking', 'Insurance', 'Investment', 'Fintech'],
-            'subcategories_ar': ['مصرفية', 'تأمين', 'استثمار', 'تكنولوجيا مالية'],
-            'companies': ['JPMorgan Chase', 'Bank of America', 'Goldman Sachs', 'PayPal']
-        }
-    }
-
-    # Get mapping or use defaults
-    mapping = category_mappings.get(category_lower, {
-        'icon': '🏢',
-        'subcategories_en': ['Various Sectors'],
-        'subcategories_ar': ['قطاعات متنوعة'],
-        'companies': ['Various Companies']
-    })
-
     # Get image URL for category
     def get_category_image(cat_name):
         # Use search_for_reliable_image for fallback consistency
@@ -1850,21 +1632,9 @@ def get_fallback_category_info(category_name: str, language: str) -> dict:
         }
 
 
-def get_author_comprehensive_info(author_name: str, language: str = 'en') -> dict:
-    """
-    Get comprehensive author information using LLM.
-
-    Args:
-        author_name: Name of the author
-        language: Language preference
-
-    Returns:
-        Dict with comprehensive author information
-    """
-    llm_service = LLMService()
-
-    if language == 'ar':
-        prompt = f"""
+# Prompt templates for author lookups, formatted with the author name
+AUTHOR_INFO_PROMPTS = {
+    'ar': """
         أنت مساعد بحث متخصص في الأدب والكتاب. ابحث عن معلومات شاملة عن المؤلف: "{author_name}"
 
         أرجع JSON بهذا التنسيق المحدد (أسماء الحقول بالإنجليزية، القيم بالعربية):
@@ -1894,9 +1664,8 @@ def get_author_comprehensive_info(author_name: str, language: str = 'en') -> dic
         - الأعمال المشهورة: بالأسماء العربية إذا ترجمت
         - استخدم فقط رابط صفحة ويكيبيديا الحقيقية للمؤلف (وليس صفحة ملف Wikimedia)، إذا لم يوجد رابط صحيح اتركه فارغاً.
         - رابط يوتيوب: إذا كان للمؤلف قناة رسمية
-        """
-    else:
-        prompt = f"""
+        """,
+    'en': """
         You are a literature and author research assistant. Find comprehensive information about the author: "{author_name}"
 
         Return JSON with this exact structure:
@@ -1925,32 +1694,37 @@ def get_author_comprehensive_info(author_name: str, language: str = 'en') -> dic
         - Wikipedia link: ONLY direct, working Wikipedia author page link (never Wikimedia Commons file pages, never broken links; if not available, leave blank)
         - YouTube link: only if the author has an official channel
         - If author is deceased, still provide birth year and other info
-        """
+        """,
+}
 
-    try:
-        import time
-        time.sleep(0.5)  # Rate limiting
 
-        chat_completion = llm_service.client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a precise literature researcher. Provide accurate, real information about authors and writers. Follow word count requirements exactly."
-                },
-                {
-                    "role": "user",
-                    "content": prompt,
-                }
-            ],
-            model=llm_service.model,
-            response_format={"type": "json_object"},
-            temperature=0.0,  # Zero temperature for most consistent results
+@cache_entity_lookups
+@coalesce_inflight_lookups
+def get_author_comprehensive_info(author_name: str, language: str = 'en') -> dict:
+    """
+    Get comprehensive author information using LLM.
+
+    Args:
+        author_name: Name of the author
+        language: Language preference
+
+    Returns:
+        Dict with comprehensive author information
+    """
+    llm_service = get_llm_service()
+
+    prompt = AUTHOR_INFO_PROMPTS['ar' if language == 'ar' else 'en'].format(author_name=author_name)
+
+    try:
+        # Paced by the shared Groq token bucket instead of a fixed sleep
+        response = llm_service._call_json(
+            prompt,
+            temperature=0.0,
+            system_prompt="You are a precise literature researcher. Provide accurate, real information about authors and writers. Follow word count requirements exactly.",
             max_tokens=1200,
             timeout=15
         )
 
-        response = json.loads(chat_completion.choices[0].message.content)
-
         # Ensure bio word count is correct
         if 'bio' in response:
             response['bio'] = ensure_word_count(response['bio'], 200, language)
@@ -1983,9 +1757,9 @@ def get_author_comprehensive_info(author_name: str, language: str = 'en') -> dic
         return response
 
     except Exception as e:
-        print(f"LLM author info error: {e}")
+        logger.warning("LLM author info error: %s", e)
         # Fallback response
-        return get_fallback_author_info(author_name, language)
+        return {**get_fallback_author_info(author_name, language), '_fallback': True}
 
 
 
@@ -2026,24 +1800,8 @@ def get_fallback_author_info(author_name: str, language: str) -> dict:
         }
 
 
-def get_website_comprehensive_info(website_name: str, language: str = 'en') -> dict:
-    """
-    Get comprehensive website/company information using LLM.
-
-    Args:
-        website_name: Name of the website/company
-        language: Language preference
-
-    Returns:
-        Dict with comprehensive website information
-    """
-    if not website_name:
-        return get_fallback_website_info("Unknown", language)
-
-    llm_service = LLMService()
-
-    if language == 'ar':
-        prompt = f"""
+WEBSITE_INFO_PROMPTS = {
+    'ar': """
         أنت مساعد بحث متخصص. ابحث عن معلومات حقيقية ودقيقة عن: "{website_name}"
 
         أرجع JSON بهذا التنسيق المحدد (جميع النصوص باللغة العربية فقط):
@@ -2082,9 +1840,8 @@ def get_website_comprehensive_info(website_name: str, language: str = 'en') -> d
         - إذا لم تكن متأكداً 100% من وجود حساب أو تطبيق، استخدم \"\"
         - لا تنشئ روابط تخمينية أو مقترحة
         - من الأفضل إرجاع \"\" من رابط خاطئ أو غير مؤكد
-        """
-    else:
-        prompt = f"""
+        """,
+    'en': """
         You are a specialized research assistant. Find real, accurate information about: "{website_name}"
 
         Return JSON with this exact structure (ALL text in English only):
@@ -2129,36 +1886,39 @@ def get_website_comprehensive_info(website_name: str, language: str = 'en') -> d
         - Instagram: "https://www.instagram.com/netflix"
         - Facebook: "https://www.facebook.com/Netflix"
         - Twitter: "https://twitter.com/Netflix"
-        """
+        """,
+}
 
-    try:
-        import time
-        time.sleep(0.5)  # Rate limiting
 
-        chat_completion = llm_service.client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a precise information researcher. Provide accurate, real information about websites and companies. Follow word count requirements exactly."
-                },
-                {
-                    "role": "user",
-                    "content": prompt,
-                }
-            ],
-            model=llm_service.model,
-            response_format={"type": "json_object"},
-            temperature=0.0,  # Zero temperature for most consistent results
+@cache_entity_lookups
+@coalesce_inflight_lookups
+def get_website_comprehensive_info(website_name: str, language: str = 'en') -> dict:
+    """
+    Get comprehensive website/company information using LLM.
+
+    Args:
+        website_name: Name of the website/company
+        language: Language preference
+
+    Returns:
+        Dict with comprehensive website information
+    """
+    if not website_name:
+        return {**get_fallback_website_info("Unknown", language), '_fallback': True}
+
+    llm_service = get_llm_service()
+    prompt = WEBSITE_INFO_PROMPTS['ar' if language == 'ar' else 'en'].format(website_name=website_name)
+
+    try:
+        # Paced by the shared Groq token bucket
+        response = llm_service._call_json(
+            prompt,
+            temperature=0.0,
+            system_prompt="You are a precise information researcher. Provide accurate, real information about websites and companies. Follow word count requirements exactly.",
             max_tokens=1500,
             timeout=15
         )
 
-        response_content = chat_completion.choices[0].message.content
-        if not response_content:
-            raise ValueError("Empty response from LLM")
-
-        response = json.loads(response_content)
-
         # Validate response structure
         if not isinstance(response, dict):
             raise ValueError("Invalid response format from LLM")
@@ -2180,9 +1940,82 @@ def get_website_comprehensive_info(website_name: str, language: str = 'en') -> d
         return response
 
     except Exception as e:
-        print(f"LLM website info error: {e}")
+        logger.warning("LLM website info error: %s", e)
         # Fallback response
-        return get_fallback_website_info(website_name, language)
+        return {**get_fallback_website_info(website_name, language), '_fallback': True}
+
+
+# Domains each social platform / app store link must contain
+SOCIAL_PLATFORM_DOMAINS = {
+    'youtube': ('youtube.com', 'youtu.be'),
+    'instagram': ('instagram.com',),
+    'facebook': ('facebook.com', 'fb.com'),
+    'twitter': ('twitter.com', 'x.com'),
+}
+APP_STORE_DOMAINS = {
+    'playstore': ('play.google.com',),
+    'appstore': ('apps.apple.com', 'itunes.apple.com'),
+}
+
+# Substrings that give away placeholder/fake links made up by the LLM
+SOCIAL_PLACEHOLDER_PATTERNS = ('example.com', 'placeholder', 'template', 'yourcompany', 'companyname', 'website_name', 'sample')
+APP_PLACEHOLDER_PATTERNS = ('example.com', 'placeholder', 'template', 'yourapp', 'appname', 'sample')
+
+YOUTUBE_CHANNEL_PATTERNS = ('/channel/', '/c/', '/user/', '/@')
+FACEBOOK_CONTENT_PATTERNS = ('/posts/', '/photos/', '/videos/')
+
+
+def host_matches(host: str, domains: frozenset) -> bool:
+    """True if the (lower-case) host is one of the domains or a subdomain of one."""
+    # Walk up the labels: www.play.google.com, play.google.com, google.com, com
+    while host:
+        if host in domains:
+            return True
+        host = host.partition('.')[2]
+    return False
+
+
+def link_host_matches(link: str, domains: frozenset) -> bool:
+    """True if the link's host is one of the domains or a subdomain of one."""
+    try:
+        return host_matches(urlsplit(link).hostname or '', domains)
+    except ValueError:
+        return False
+
+
+def substring_pattern(substrings) -> re.Pattern:
+    """Compile a case-insensitive pattern matching any of the given literal substrings."""
+    return re.compile('|'.join(map(re.escape, substrings)), re.IGNORECASE | re.ASCII)
+
+
+# The checks above as single compiled patterns, so links are scanned once without lowercasing
+SOCIAL_PLATFORM_HOSTS = {platform: frozenset(domains) for platform, domains in SOCIAL_PLATFORM_DOMAINS.items()}
+APP_STORE_HOSTS = {store: frozenset(domains) for store, domains in APP_STORE_DOMAINS.items()}
+SOCIAL_PLACEHOLDER_RE = substring_pattern(SOCIAL_PLACEHOLDER_PATTERNS)
+APP_PLACEHOLDER_RE = substring_pattern(APP_PLACEHOLDER_PATTERNS)
+YOUTUBE_CHANNEL_RE = substring_pattern(YOUTUBE_CHANNEL_PATTERNS)
+# Post/tweet/photo paths that point at content rather than the official profile
+SOCIAL_CONTENT_PATH_RES = {
+    'instagram': substring_pattern(('/p/',)),
+    'facebook': substring_pattern(FACEBOOK_CONTENT_PATTERNS),
+    'twitter': substring_pattern(('/status/',)),
+}
+APPSTORE_APP_PATH_RE = substring_pattern(('/app/', '/id'))
+
+# Known favicons for popular websites
+WEBSITE_ICONS = {
+    'netflix': 'https://assets.nflxext.com/us/ffe/siteui/common/icons/nficon2016.ico',
+    'google': 'https://www.google.com/favicon.ico',
+    'youtube': 'https://www.youtube.com/favicon.ico',
+    'facebook': 'https://static.xx.fbcdn.net/rsrc.php/yo/r/iRmz9lCMBD2.ico',
+    'instagram': 'https://static.cdninstagram.com/rsrc.php/v3/yt/r/30PrGfR3xhI.ico',
+    'twitter': 'https://abs.twimg.com/favicons/twitter.3.ico',
+    'amazon': 'https://www.amazon.com/favicon.ico',
+    'microsoft': 'https://www.microsoft.com/favicon.ico',
+    'apple': 'https://www.apple.com/favicon.ico',
+    'linkedin': 'https://static.licdn.com/sc/h/al2o9zrvru7aqj8e1x2rzsrca',
+    'tiktok': 'https://sf16-website-login.neutral.ttwstatic.com/obj/tiktok_web_login_static/tiktok/webapp/main/webapp-desktop/8152caf0c8e8bc67ae0d.ico'
+}
 
 
 def clean_social_media_links(response: dict, website_name: str) -> dict:
@@ -2204,7 +2037,7 @@ def clean_social_media_links(response: dict, website_name: str) -> dict:
         social_media = response['social_media']
 
         # Validate each social media link
-        for platform in ['youtube', 'instagram', 'facebook', 'twitter']:
+        for platform in SOCIAL_PLATFORM_DOMAINS:
             if platform in social_media:
                 link = social_media[platform]
                 if link and not is_valid_social_link(link, platform, website_name):
@@ -2215,7 +2048,7 @@ def clean_social_media_links(response: dict, website_name: str) -> dict:
         app_links = response['app_links']
 
         # Validate app store links
-        for store in ['playstore', 'appstore']:
+        for store in APP_STORE_DOMAINS:
             if store in app_links:
                 link = app_links[store]
                 if link and not is_valid_app_link(link, store):
@@ -2236,56 +2069,41 @@ def is_valid_social_link(link: str, platform: str, website_name: str) -> bool:
     Returns:
         True if link appears valid, False otherwise
     """
-    if not link or not link.startswith('http'):
+    if not link or not website_name:
         return False
 
-    if not website_name:
+    # Links like "youtube.com/netflix" come without a scheme
+    if '://' not in link:
+        link = 'https://' + link
+
+    try:
+        parts = urlsplit(link)
+        host = parts.hostname or ''
+    except ValueError:
         return False
 
-    # Check if link contains the correct domain
-    platform_domains = {
-        'youtube': ['youtube.com', 'youtu.be'],
-        'instagram': ['instagram.com'],
-        'facebook': ['facebook.com', 'fb.com'],
-        'twitter': ['twitter.com', 'x.com']
-    }
+    if parts.scheme.lower() not in ('http', 'https'):
+        return False
 
-    domains = platform_domains.get(platform, [])
-    if not link or not any(domain in link.lower() for domain in domains):
+    # Reject on the host first; the remaining checks only look at host and path, never the query string
+    if not host_matches(host, SOCIAL_PLATFORM_HOSTS.get(platform, frozenset())):
         return False
+    location = host + parts.path
 
     # Check for invalid patterns that indicate placeholder/fake links
-    invalid_patterns = [
-        'example.com',
-        'placeholder',
-        'template',
-        'yourcompany',
-        'companyname',
-        'website_name',
-        'sample'
-    ]
-
-    link_lower = link.lower()
-    if any(pattern in link_lower for pattern in invalid_patterns):
+    if SOCIAL_PLACEHOLDER_RE.search(location):
         return False
 
     # Basic structure validation for each platform
     if platform == 'youtube':
         # Accept various YouTube URL patterns - be more permissive
         # Valid patterns: /channel/, /c/, /user/, /@, or just youtube.com/companyname
-        return (any(pattern in link_lower for pattern in ['/channel/', '/c/', '/user/', '/@']) or
-                ('youtube.com/' in link_lower and len(link_lower.split('/')[-1]) > 2))
-    elif platform == 'instagram':
-        # Should have username after instagram.com/
-        return '/p/' not in link_lower  # Not a post link
-    elif platform == 'facebook':
-        # Should not be a post or photo link
-        return not any(pattern in link_lower for pattern in ['/posts/', '/photos/', '/videos/'])
-    elif platform == 'twitter':
-        # Should be a profile link, not a tweet
-        return '/status/' not in link_lower
+        return bool(YOUTUBE_CHANNEL_RE.search(parts.path) or
+                    ('youtube.com/' in location.lower() and len(parts.path.rsplit('/', 1)[-1]) > 2))
 
-    return True
+    # Instagram posts, Facebook posts/photos/videos and tweets are not profile links
+    content_path_re = SOCIAL_CONTENT_PATH_RES.get(platform)
+    return content_path_re is None or not content_path_re.search(parts.path)
 
 
 def is_valid_app_link(link: str, store: str) -> bool:
@@ -2302,37 +2120,21 @@ def is_valid_app_link(link: str, store: str) -> bool:
     if not link or not link.startswith('http'):
         return False
 
-    # Check if link contains the correct domain
-    store_domains = {
-        'playstore': ['play.google.com'],
-        'appstore': ['apps.apple.com', 'itunes.apple.com']
-    }
-
-    domains = store_domains.get(store, [])
-    if not link or not any(domain in link.lower() for domain in domains):
+    # Check the link is hosted on the store's domain
+    if not link_host_matches(link, APP_STORE_HOSTS.get(store, frozenset())):
         return False
 
     # Check for invalid patterns that indicate placeholder/fake links
-    invalid_patterns = [
-        'example.com',
-        'placeholder',
-        'template',
-        'yourapp',
-        'appname',
-        'sample'
-    ]
-
-    link_lower = link.lower()
-    if any(pattern in link_lower for pattern in invalid_patterns):
+    if APP_PLACEHOLDER_RE.search(link):
         return False
 
     # Additional validation for each store
     if store == 'playstore':
         # Should have /store/apps/details?id= pattern
-        return '/store/apps/details?id=' in link_lower
+        return '/store/apps/details?id=' in link.lower()
     elif store == 'appstore':
         # Should have /app/ pattern or /id pattern
-        return '/app/' in link_lower or '/id' in link_lower
+        return bool(APPSTORE_APP_PATH_RE.search(link))
 
     return True
 
@@ -2352,29 +2154,46 @@ def get_website_icon_url(website_name: str) -> str:
 
     website_lower = website_name.lower()
 
-    # Common favicon patterns for popular websites
-    icon_patterns = {
-        'netflix': 'https://assets.nflxext.com/us/ffe/siteui/common/icons/nficon2016.ico',
-        'google': 'https://www.google.com/favicon.ico',
-        'youtube': 'https://www.youtube.com/favicon.ico',
-        'facebook': 'https://static.xx.fbcdn.net/rsrc.php/yo/r/iRmz9lCMBD2.ico',
-        'instagram': 'https://static.cdninstagram.com/rsrc.php/v3/yt/r/30PrGfR3xhI.ico',
-        'twitter': 'https://abs.twimg.com/favicons/twitter.3.ico',
-        'amazon': 'https://www.amazon.com/favicon.ico',
-        'microsoft': 'https://www.microsoft.com/favicon.ico',
-        'apple': 'https://www.apple.com/favicon.ico',
-        'linkedin': 'https://static.licdn.com/sc/h/al2o9zrvru7aqj8e1x2rzsrca',
-        'tiktok': 'https://sf16-website-login.neutral.ttwstatic.com/obj/tiktok_web_login_static/tiktok/webapp/main/webapp-desktop/8152caf0c8e8bc67ae0d.ico'
-    }
-
     # Return specific icon if available, otherwise use standard favicon pattern
-    return icon_patterns.get(website_lower, f"https://{website_lower}.com/favicon.ico")
+    return WEBSITE_ICONS.get(website_lower) or f"https://{website_lower}.com/favicon.ico"
 
 
 # Removed get_website_api_info function to prevent duplicate social media links
 # The LLM service now provides comprehensive and accurate social media links
 
 
+# Categories guessed for well-known websites when the LLM lookup fails: icon plus (name, wikilink) per language
+WEBSITE_FALLBACK_CATEGORIES = {
+    'entertainment': {
+        'icon': "🎬",
+        'ar': ("الترفيه", "https://ar.wikipedia.org/wiki/ترفيه"),
+        'en': ("Entertainment", "https://en.wikipedia.org/wiki/Entertainment"),
+    },
+    'technology': {
+        'icon': "💻",
+        'ar': ("التكنولوجيا", "https://ar.wikipedia.org/wiki/تكنولوجيا"),
+        'en': ("Technology", "https://en.wikipedia.org/wiki/Technology"),
+    },
+    'social_media': {
+        'icon': "📱",
+        'ar': ("وسائل التواصل الاجتماعي", "https://ar.wikipedia.org/wiki/وسائل_التواصل_الاجتماعي"),
+        'en': ("Social Media", "https://en.wikipedia.org/wiki/Social_media"),
+    },
+    'ecommerce': {
+        'icon': "🛒",
+        'ar': ("التجارة الإلكترونية", "https://ar.wikipedia.org/wiki/تجارة_إلكترونية"),
+        'en': ("E-commerce", "https://en.wikipedia.org/wiki/E-commerce"),
+    },
+}
+# Anything not listed falls back to technology; amazon is filed under technology
+WEBSITE_FALLBACK_CATEGORY_BY_NAME = {
+    **dict.fromkeys(('netflix', 'youtube', 'disney', 'hulu', 'spotify'), 'entertainment'),
+    **dict.fromkeys(('google', 'microsoft', 'apple', 'amazon', 'meta'), 'technology'),
+    **dict.fromkeys(('facebook', 'instagram', 'twitter', 'linkedin', 'tiktok'), 'social_media'),
+    **dict.fromkeys(('ebay', 'alibaba', 'shopify'), 'ecommerce'),
+}
+
+
 def get_fallback_website_info(website_name: str, language: str) -> dict:
     """
     Fallback website information when LLM fails.
@@ -2390,28 +2209,10 @@ def get_fallback_website_info(website_name: str, language: str) -> dict:
         website_name = "Unknown Website"
 
     # Try to guess category based on common website names
-    website_lower = website_name.lower()
-
-    if website_lower in ['netflix', 'youtube', 'disney', 'hulu', 'spotify']:
-        category_name = "الترفيه" if language == 'ar' else "Entertainment"
-        category_icon = "🎬"
-        category_wiki = "https://ar.wikipedia.org/wiki/ترفيه" if language == 'ar' else "https://en.wikipedia.org/wiki/Entertainment"
-    elif website_lower in ['google', 'microsoft', 'apple', 'amazon', 'meta']:
-        category_name = "التكنولوجيا" if language == 'ar' else "Technology"
-        category_icon = "💻"
-        category_wiki = "https://ar.wikipedia.org/wiki/تكنولوجيا" if language == 'ar' else "https://en.wikipedia.org/wiki/Technology"
-    elif website_lower in ['facebook', 'instagram', 'twitter', 'linkedin', 'tiktok']:
-        category_name = "وسائل التواصل الاجتماعي" if language == 'ar' else "Social Media"
-        category_icon = "📱"
-        category_wiki = "https://ar.wikipedia.org/wiki/وسائل_التواصل_الاجتماعي" if language == 'ar' else "https://en.wikipedia.org/wiki/Social_media"
-    elif website_lower in ['amazon', 'ebay', 'alibaba', 'shopify']:
-        category_name = "التجارة الإلكترونية" if language == 'ar' else "E-commerce"
-        category_icon = "🛒"
-        category_wiki = "https://ar.wikipedia.org/wiki/تجارة_إلكترونية" if language == 'ar' else "https://en.wikipedia.org/wiki/E-commerce"
-    else:
-        category_name = "التكنولوجيا" if language == 'ar' else "Technology"
-        category_icon = "💻"
-        category_wiki = "https://ar.wikipedia.org/wiki/تكنولوجيا" if language == 'ar' else "https://en.wikipedia.org/wiki/Technology"
+    category_key = WEBSITE_FALLBACK_CATEGORY_BY_NAME.get(website_name.lower(), 'technology')
+    category = WEBSITE_FALLBACK_CATEGORIES[category_key]
+    category_icon = category['icon']
+    category_name, category_wiki = category['ar' if language == 'ar' else 'en']
 
     if language == 'ar':
         return {
@@ -2455,6 +2256,28 @@ def get_fallback_website_info(website_name: str, language: str) -> dict:
         }
 
 
+# Padding for ensure_word_count, split into words once; extensions are keyed by
+# language and how many words are missing (5, 10, 15 or more)
+WORD_COUNT_EXTENSION_WORDS = {
+    ('ar', 5): tuple("وغيرها من الخدمات المميزة.".split()),
+    ('ar', 10): tuple("وغيرها من الخدمات المميزة التي تلبي احتياجات المستخدمين.".split()),
+    ('ar', 15): tuple("وغيرها من الخدمات المميزة التي تلبي احتياجات المستخدمين في مختلف أنحاء العالم.".split()),
+    ('ar', None): tuple("وغيرها من الخدمات المميزة التي تلبي احتياجات المستخدمين في مختلف أنحاء العالم، مما يجعلها خياراً مفضلاً للكثيرين.".split()),
+    ('en', 5): tuple("and other similar services.".split()),
+    ('en', 10): tuple("and other similar services that meet user needs and expectations.".split()),
+    ('en', 15): tuple("and other similar services that meet user needs and expectations in various markets worldwide.".split()),
+    ('en', None): tuple("and other similar services that meet user needs and expectations in various markets worldwide, making it a preferred choice for many users globally.".split()),
+}
+WORD_COUNT_CONCLUSION_WORDS = {
+    'ar': tuple("هذه المنصة تستمر في التطور والنمو لتقديم أفضل تجربة ممكنة للمستخدمين في جميع أنحاء العالم.".split()),
+    'en': tuple("This platform continues to evolve and grow to provide the best possible experience for users around the world.".split()),
+}
+
+# Whitespace that would make a space count disagree with str.split(): any
+# non-space whitespace, doubled spaces, or leading/trailing spaces
+IRREGULAR_WHITESPACE_RE = re.compile(r'[^\S ]|  |\A | \Z')
+
+
 def ensure_word_count(text: str, target_words: int, language: str = 'en') -> str:
     """
     Ensure text meets the target word count.
@@ -2475,7 +2298,12 @@ def ensure_word_count(text: str, target_words: int, language: str = 'en') -> str
             base_text = "This is a basic description of the requested topic"
         text = base_text
 
-    words = text.split()
+    # Already the right length: count spaces instead of splitting when the spacing is regular
+    if text.count(' ') + 1 == target_words and not IRREGULAR_WHITESPACE_RE.search(text):
+        return text
+
+    # Split no further than needed: an extra (unsplit) tail only tells us the text is too long
+    words = text.split(None, target_words)
     current_count = len(words)
 
     # If already correct, return as is
@@ -2484,51 +2312,36 @@ def ensure_word_count(text: str, target_words: int, language: str = 'en') -> str
 
     # If too long, truncate
     elif current_count > target_words:
-        return ' '.join(words[:target_words])
+        del words[target_words:]
+        return ' '.join(words)
 
     # If too short, extend carefully
     else:
         # Only add a few words to reach target, don't over-extend
         words_needed = target_words - current_count
-
-        # Create a more natural extension
-        if language == 'ar':
-            if words_needed <= 5:
-                extension = "وغيرها من الخدمات المميزة."
-            elif words_needed <= 10:
-                extension = "وغيرها من الخدمات المميزة التي تلبي احتياجات المستخدمين."
-            elif words_needed <= 15:
-                extension = "وغيرها من الخدمات المميزة التي تلبي احتياجات المستخدمين في مختلف أنحاء العالم."
-            else:
-                extension = "وغيرها من الخدمات المميزة التي تلبي احتياجات المستخدمين في مختلف أنحاء العالم، مما يجعلها خياراً مفضلاً للكثيرين."
+        padding_language = 'ar' if language == 'ar' else 'en'
+
+        # Pick a more natural extension for the number of missing words
+        if words_needed <= 5:
+            bucket = 5
+        elif words_needed <= 10:
+            bucket = 10
+        elif words_needed <= 15:
+            bucket = 15
         else:
-            if words_needed <= 5:
-                extension = "and other similar services."
-            elif words_needed <= 10:
-                extension = "and other similar services that meet user needs and expectations."
-            elif words_needed <= 15:
-                extension = "and other similar services that meet user needs and expectations in various markets worldwide."
-            else:
-                extension = "and other similar services that meet user needs and expectations in various markets worldwide, making it a preferred choice for many users globally."
+            bucket = None
 
         # Add the extension and check if we need more words
-        extension_words = extension.split()
-        words.extend(extension_words[:min(words_needed, len(extension_words))])
+        words.extend(WORD_COUNT_EXTENSION_WORDS[(padding_language, bucket)][:words_needed])
 
         # If we still need more words, add a natural conclusion
         if len(words) < target_words:
             remaining_words = target_words - len(words)
-
-            if language == 'ar':
-                conclusion = "هذه المنصة تستمر في التطور والنمو لتقديم أفضل تجربة ممكنة للمستخدمين في جميع أنحاء العالم."
-            else:
-                conclusion = "This platform continues to evolve and grow to provide the best possible experience for users around the world."
-
-            conclusion_words = conclusion.split()
-            words.extend(conclusion_words[:min(remaining_words, len(conclusion_words))])
+            words.extend(WORD_COUNT_CONCLUSION_WORDS[padding_language][:remaining_words])
 
         # Final check to ensure exact count
-        return ' '.join(words[:target_words])
+        del words[target_words:]
+        return ' '.join(words)
 
 
 def enhance_single_result(result, llm_service, language):
@@ -2571,6 +2384,31 @@ def enhance_single_result(result, llm_service, language):
     return clean_result
 
 
+def enhance_result_or_original(result, llm_service, language):
+    """
+    Enhance a single search result, falling back to the original result if enhancement fails.
+    """
+    try:
+        return enhance_single_result(result, llm_service, language)
+    except Exception as e:
+        logger.warning("Error enhancing result: %s", e)
+        return result
+
+
+def enhance_and_translate_result(result, llm_service, language):
+    """
+    Enhance a single search result and, for Arabic searches, translate it.
+    Falls back to the original result if enhancement fails.
+    """
+    enhanced_result = enhance_result_or_original(result, llm_service, language)
+
+    # Translate main fields to Arabic if needed; the untouched original is returned as-is
+    if language == 'ar' and enhanced_result is not result:
+        enhanced_result = translate_result_to_arabic(enhanced_result, llm_service)
+
+    return enhanced_result
+
+
 def translate_result_to_arabic(result: dict, llm_service) -> dict:
     """
     Translate main result fields to Arabic.
@@ -2603,10 +2441,10 @@ def translate_result_to_arabic(result: dict, llm_service) -> dict:
             if 'author_info' in result and isinstance(result['author_info'], dict):
                 result['author_info']['name'] = translated_author_name
 
-        print(f"Translated: {title} -> {result.get('title')}")
+        logger.debug("Translated: %s -> %s", title, result.get('title'))
 
     except Exception as e:
-        print(f"Translation failed: {e}")
+        logger.warning("Translation failed: %s", e)
         # Continue with original text if translation fails
 
     return result
@@ -2649,7 +2487,7 @@ def ai_book_search(request):
         search_session = str(uuid.uuid4())
         
         # Initialize services
-        llm_service = LLMService()
+        llm_service = get_llm_service()
         external_apis_service = ExternalAPIsService()
         
         # Step 1: Use LLM to extract and understand the query (LLM-first approach)
@@ -2659,25 +2497,17 @@ def ai_book_search(request):
         search_results = external_apis_service.search_all_sources(extracted_info, max_results)
         
         # Step 3: Enhance results with LLM-generated content (parallel processing for speed)
-        enhanced_results = []
-
-        # Process results sequentially to avoid rate limiting and timeout issues
-        for result in search_results:
-            try:
-                enhanced_result = enhance_single_result(result, llm_service, language)
-                enhanced_results.append(enhanced_result)
-            except Exception as e:
-                print(f"Error enhancing result: {e}")
-                # Add the original result if enhancement fails
-                enhanced_results.append(result)
+        # Groq pacing is handled by the shared token bucket, so the I/O bound calls can overlap;
+        # map keeps the original order
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(len(search_results), 8))) as executor:
+            enhanced_results = list(executor.map(
+                lambda result: enhance_result_or_original(result, llm_service, language),
+                search_results
+            ))
         
-        # Step 4: Save search results to database for later selection
-        saved_results = []
-        for result in enhanced_results:
-            # Set PDF verification status
-            pdf_verified = result.get('pdf_verified', False)
-
-            search_result = BookSearchResult.objects.create(
+        # Step 4: Save search results to database for later selection (one multi-row INSERT)
+        saved_results = BookSearchResult.objects.bulk_create([
+            BookSearchResult(
                 search_session=search_session,
                 title=result.get('title', ''),
                 author=result.get('author', ''),
@@ -2686,7 +2516,7 @@ def ai_book_search(request):
                 cover_image_url=result.get('cover_image_url'),
                 pdf_url=result.get('pdf_url'),
                 pdf_source=result.get('pdf_source'),
-                pdf_verified=pdf_verified,  # Set verification status
+                pdf_verified=result.get('pdf_verified', False),  # Set verification status
                 isbn=result.get('isbn'),
                 publication_date=result.get('publication_date', ''),
                 publisher=result.get('publisher', ''),
@@ -2697,13 +2527,14 @@ def ai_book_search(request):
                 external_id=result.get('external_id'),
                 relevance_score=result.get('relevance_score', 0.0)
             )
+            for result in enhanced_results
+        ])
 
-            # Attach structured data for serialization
+        # Attach structured data for serialization
+        for search_result, result in zip(saved_results, enhanced_results):
             search_result._structured_categories = result.get('structured_categories', [])
             search_result._structured_author = result.get('structured_author', {})
             search_result._ai_book_summary = result.get('ai_book_summary', '')
-
-            saved_results.append(search_result)
         
         # Serialize results for response
         serializer = BookSearchResultSerializer(saved_results, many=True)
@@ -2716,10 +2547,7 @@ def ai_book_search(request):
         }, status=status.HTTP_200_OK)
         
     except Exception as e:
-        import traceback
-        error_details = traceback.format_exc()
-        print(f"Search failed with error: {e}")
-        print(f"Full traceback: {error_details}")
+        logger.exception("Search failed with error: %s", e)
 
         return Response(
             {'error': f'Search failed: {str(e)}'},
@@ -2727,6 +2555,21 @@ def ai_book_search(request):
         )
 
 
+def attach_converted_pdf(book_id: int, file_url: str, book_title: str, book_author: str):
+    """Convert an EPUB/MOBI file to PDF in the background and save it as the book's pdf_file."""
+    try:
+        pdf_result = PDFService().process_book_file(file_url, book_title, book_author)
+        if pdf_result['success']:
+            Book.objects.filter(id=book_id).update(pdf_file=pdf_result['file_path'])
+        else:
+            logger.warning("Background conversion failed for book %s: %s", book_id, pdf_result['error'])
+    except Exception:
+        logger.exception("Background conversion error for book %s", book_id)
+    finally:
+        # Worker threads do not go through the request cycle, so release DB connections here
+        close_old_connections()
+
+
 @api_view(['POST'])
 def add_book_from_search(request):
     """
@@ -2745,8 +2588,12 @@ def add_book_from_search(request):
     {
         "book_id": int,
         "message": "string",
-        "pdf_status": "downloaded|failed|skipped"
+        "pdf_status": "downloaded|failed|skipped|processing"
     }
+
+    EPUB/MOBI files are converted in the background: the response is 202 with
+    pdf_status "processing", and the converted file is saved to the book's pdf_file
+    once the conversion finishes (served by GET /api/books/<book_id>/).
     """
     
     try:
@@ -2765,17 +2612,17 @@ def add_book_from_search(request):
         # Get the search result
         search_result = get_object_or_404(BookSearchResult, id=search_result_id)
         
-        # Check if book already exists (avoid duplicates)
-        existing_book = Book.objects.filter(
+        # Check if book already exists (avoid duplicates); only the id is needed
+        existing_book_id = Book.objects.filter(
             title__iexact=search_result.title,
             author__iexact=search_result.author
-        ).first()
+        ).values_list('id', flat=True).first()
         
-        if existing_book:
+        if existing_book_id:
             return Response(
                 {
                     'error': 'Book already exists in database',
-                    'existing_book_id': existing_book.id
+                    'existing_book_id': existing_book_id
                 },
                 status=status.HTTP_409_CONFLICT
             )
@@ -2784,9 +2631,12 @@ def add_book_from_search(request):
         pdf_service = PDFService()
         pdf_status = 'skipped'
         pdf_file_path = None
+        convert_in_background = download_pdf and pdf_service.needs_conversion(search_result.pdf_url)
         
-        # Handle PDF download if requested
-        if download_pdf and search_result.pdf_url:
+        # Handle PDF download if requested (EPUB/MOBI conversions are queued after the book is created)
+        if convert_in_background:
+            pdf_status = 'processing'
+        elif download_pdf and search_result.pdf_url:
             pdf_result = pdf_service.process_book_file(
                 search_result.pdf_url,
                 search_result.title,
@@ -2816,6 +2666,15 @@ def add_book_from_search(request):
             related_books=search_result.ai_categories
         )
         
+        if convert_in_background:
+            conversion_executor.submit(
+                attach_converted_pdf,
+                book.id,
+                search_result.pdf_url,
+                search_result.title,
+                search_result.author
+            )
+        
         # Clean up: optionally delete the search result
         # search_result.delete()  # Uncomment if you want to clean up search results
         
@@ -2824,7 +2683,7 @@ def add_book_from_search(request):
             'message': f'Book "{book.title}" added successfully',
             'pdf_status': pdf_status,
             'book': BookSerializer(book).data
-        }, status=status.HTTP_201_CREATED)
+        }, status=status.HTTP_202_ACCEPTED if convert_in_background else status.HTTP_201_CREATED)
         
     except Exception as e:
         return Response(
@@ -2846,12 +2705,13 @@ def get_search_results(request, search_session):
     """
     
     try:
-        results = BookSearchResult.objects.filter(search_session=search_session)
+        # Load the rows once; the total is their length rather than a second COUNT query
+        results = list(BookSearchResult.objects.filter(search_session=search_session))
         serializer = BookSearchResultSerializer(results, many=True)
         
         return Response({
             'results': serializer.data,
-            'total': results.count()
+            'total': len(results)
         }, status=status.HTTP_200_OK)
         
     except Exception as e:
@@ -2889,12 +2749,17 @@ def verify_pdf_link(request):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        # Results pages are refreshed often, so reuse recent answers for the same link
+        cache_key = f"pdfverify-view:{hashlib.sha1(pdf_url.encode()).hexdigest()}"
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return Response(cached, status=status.HTTP_200_OK)
+        
         pdf_service = PDFService()
         
         # Use a lightweight verification (HEAD request)
-        import requests
         try:
-            response = requests.head(pdf_url, headers=pdf_service.headers, timeout=10, allow_redirects=True)
+            response = pdf_service.session.head(pdf_url, timeout=10, allow_redirects=True)
             
             is_valid = response.status_code == 200
             content_type = response.headers.get('content-type', '')
@@ -2906,12 +2771,15 @@ def verify_pdf_link(request):
             else:
                 error = None if is_valid else f"HTTP {response.status_code}"
             
-            return Response({
+            result = {
                 'is_valid': is_valid,
                 'error': error,
                 'file_size': int(content_length) if content_length else None,
                 'content_type': content_type
-            }, status=status.HTTP_200_OK)
+            }
+            # Network errors below are not cached: they are usually transient
+            cache.set(cache_key, result, PDF_LINK_CHECK_CACHE_TTL if is_valid else PDF_LINK_CHECK_FAILURE_CACHE_TTL)
+            return Response(result, status=status.HTTP_200_OK)
             
         except requests.exceptions.RequestException as e:
             return Response({
@@ -2928,6 +2796,22 @@ def verify_pdf_link(request):
         )
 
 
+class CachedCountPaginator(Paginator):
+    """Paginator that reuses the COUNT(*) for the same filters across requests."""
+
+    def __init__(self, object_list, per_page, count_cache_key, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_cache_key = count_cache_key
+
+    @functools.cached_property
+    def count(self):
+        total = cache.get(self.count_cache_key)
+        if total is None:
+            total = super().count
+            cache.set(self.count_cache_key, total, BOOK_COUNT_CACHE_TTL)
+        return total
+
+
 @api_view(['GET'])
 def list_books(request):
     """
@@ -2951,8 +2835,6 @@ def list_books(request):
     """
     
     try:
-        from django.core.paginator import Paginator
-        from django.db.models import Q
         
         # Get query parameters
         page = int(request.GET.get('page', 1))
@@ -2976,8 +2858,10 @@ def list_books(request):
                 Q(author__icontains=search_query)
             )
         
-        # Paginate
-        paginator = Paginator(queryset, page_size)
+        # Paginate; every page of the same listing shares one cached total
+        filters_key = json.dumps([status_filter, language_filter, search_query])
+        count_cache_key = f"bookcount:{hashlib.sha1(filters_key.encode()).hexdigest()}"
+        paginator = CachedCountPaginator(queryset, page_size, count_cache_key)
         page_obj = paginator.get_page(page)
         
         # Serialize